@@ -0,0 +1,298 @@
+#******************************************************************************
+# file:    driver.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2025/04/07
+#
+# about:   Brief
+# Bus Driver for Wishbone B4 Pipelined Master/echoSlave
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+
+from collections import deque
+
+from ..version import __version__
+from ..standard.absbus import *
+from ..standard.driver import wishboneStandardMaster, wishboneStandardEchoSlave
+
+import cocotb
+
+from cocotb.triggers import FallingEdge, RisingEdge, Event
+from cocotb.result import TestFailure
+from cocotb.binary import BinaryValue
+from cocotb.queue import Queue
+
+# Class: wishbonePipelineMaster
+# Drive slave devices over the Wishbone B4 Pipelined bus. A new strobe is issued
+# every cycle the slave has STALL low, with up to outstanding requests waiting on ACK.
+# ERR and RTY retire requests with that status, they are not sent again. It runs its
+# own loop, a scheduler is not supported.
+class wishbonePipelineMaster(wishboneStandardMaster):
+  # Variable: _optional_signals
+  # List of optional signals, stall is added for pipelined mode. No stall means the slave never stalls.
+  _optional_signals = wishboneStandardMaster._optional_signals + ["stall"]
+
+  # Constructor: __init__
+  # Setup defaults and call base class constructor. outstanding is the number of
+  # requests that may be waiting on ACK at one time.
+  def __init__(self, entity, name, clock, reset, outstanding=8, *args, **kwargs):
+    super().__init__(entity, name, clock, reset, *args, **kwargs)
+
+    if(outstanding < 1):
+      raise ValueError("Outstanding request window must be at least 1.")
+
+    if(self._scheduler is not None):
+      raise ValueError("Pipelined master runs its own loop and can not be stepped by a scheduler.")
+
+    self.outstanding = outstanding
+
+    # Assign a noSignal object with a value attribute. That way if we
+    # do a simple if check, stall does not exist and the slave never stalls.
+    self._stall = getattr(self.bus, "stall", noSignal(False))
+
+  # Method: _run
+  # _run thread that issues requests from the command queue every cycle STALL is low,
+  # and retires them in order as ACKs arrive.
+  async def _run(self):
+    self.active = False
+
+    # request currently driven on the bus, not yet accepted by the slave.
+    trans = None
+    # type of the current cycle, writes or reads.
+    we = 0
+    # accepted requests waiting on ACK, oldest first.
+    inflight = deque()
+
+    await self._measure_clock()
+
+    while True:
+      await RisingEdge(self.clock)
+
+      self._tick()
+
+      # when in reset, set values and idle. Requests cut off by it end with ERR.
+      if self._reset.value:
+        self._idle()
+
+        if(trans is not None):
+          inflight.append(trans)
+          trans = None
+
+        while inflight:
+          self._complete(inflight.popleft(), we, wishboneStandardStatus.ERR)
+
+        self.active = False
+        self._state = wishboneStandardState.IDLE
+        continue
+
+      if(self._state == wishboneStandardState.IDLE):
+        trans = self._next()
+
+        if(trans is None):
+          self._drained(1)
+          self._drained(0)
+          await self._sleep()
+          continue
+
+        we = trans.we
+
+        self.active = True
+        self._drive(trans, we)
+        self._state = wishboneStandardState.ACTIVE
+        continue
+
+      # request phase, a strobe with stall low was taken by the slave.
+      if trans is not None and not self._stall.value:
+        inflight.append(trans)
+        trans = None
+
+      # response phase, ACK, ERR or RTY retire accepted requests in order.
+      if inflight:
+        status = self._termination()
+        if(status != wishboneStandardStatus.NONE):
+          self._complete(inflight.popleft(), we, status)
+
+      # still waiting on the slave to take the current request.
+      if trans is not None:
+        continue
+
+      if(len(inflight) < self.outstanding):
+        trans = self._next(we)
+
+        if(trans is not None):
+          self._drive(trans, we)
+          continue
+
+        # nothing left to issue or retire, end the cycle.
+        if not inflight:
+          self._idle()
+          self.active = False
+          self._state = wishboneStandardState.IDLE
+          self._drained(we)
+          continue
+
+      self._set(self.bus.stb, 0)
+
+# Class: wishbonePipelineEchoSlave
+# Respond to pipelined master reads and writes by returning data, simple echo core.
+# Every request is accepted, and terminated latency cycles later, in order. New requests
+# are accepted while earlier ones wait for their termination. Wait states hold
+# STALL high after a request is accepted, so they need the stall signal. faults picks
+# requests to end with ERR or RTY like the Classic slaves, asynchronous and a scheduler are not supported.
+class wishbonePipelineEchoSlave(wishboneStandardEchoSlave):
+  # Variable: _optional_signals
+  # List of optional signals, stall is added for pipelined mode.
+  _optional_signals = wishboneStandardEchoSlave._optional_signals + ["stall"]
+
+  # Constructor: __init__
+  # Setup defaults and call base class constructor. latency is the number of cycles from
+  # a request being accepted to its termination, at least 1.
+  def __init__(self, entity, name, clock, reset, numreg=256, *args, latency=1, **kwargs):
+    super().__init__(entity, name, clock, reset, numreg, *args, **kwargs)
+
+    if(latency < 1):
+      raise ValueError("Pipelined slave latency must be at least 1.")
+
+    self.latency = latency
+
+    if(self.asynchronous):
+      raise ValueError("Pipelined slave does not support asynchronous termination.")
+
+    if(self._scheduler is not None):
+      raise ValueError("Pipelined slave runs its own loop and can not be stepped by a scheduler.")
+
+    if hasattr(self.bus, "stall"):
+      self.bus.stall.setimmediatevalue(0)
+
+  # Function: wait
+  # Wait states are driven on STALL, so they can only be set when the bus has it.
+  @wishboneStandardEchoSlave.wait.setter
+  def wait(self, wait):
+    if(wait and not hasattr(self.bus, "stall")):
+      raise ValueError("Pipelined slave wait states need a stall signal.")
+
+    wishboneStandardEchoSlave.wait.fset(self, wait)
+
+  # Function: _stall
+  # Drive STALL, when the bus has it.
+  def _stall(self, value):
+    if hasattr(self.bus, "stall"):
+      self._set(self.bus.stall, value)
+
+  # Function: _serve
+  # Do an accepted request and terminate it, returns the status it was terminated with. data and sel
+  # are the ones captured when it was accepted, the bus has moved on if it was held in wait states.
+  def _serve(self, address, we, data, sel):
+    status = self._status(address, we)
+
+    if(status == wishboneStandardStatus.ACK):
+      if(we):
+        self._write(address, data, sel)
+      else:
+        self._set(self.bus.data_o, self._read(address))
+
+    self._terminate(status)
+
+    if(we):
+      self._idle_write.set()
+    else:
+      self._idle_read.set()
+
+    return status
+
+  # Method: _run
+  # _run thread that accepts a request every cycle STALL is low and terminates it latency cycles
+  # later, plus its wait states. Inputs are sampled once per edge, outputs are only written when they change.
+  async def _run(self):
+    self.active = False
+
+    # accepted requests waiting on termination, oldest first, as
+    # [cycles left, (address, we, data, sel), wait states].
+    responses = deque()
+    # cycles STALL is still held for the wait states of the last request.
+    stall_left = 0
+
+    cocotb.start_soon(self._measure_clock())
+
+    while True:
+      await RisingEdge(self.clock)
+
+      self._tick()
+
+      if self._reset.value:
+        self._state = wishboneStandardState.IDLE
+        responses.clear()
+        stall_left = 0
+
+        self._stall(0)
+        self._terminate(wishboneStandardStatus.NONE)
+        self._set(self.bus.data_o, 0)
+        continue
+
+      # no cycle on the bus, requests still waiting are abandoned.
+      if(not self.bus.cyc.value):
+        responses.clear()
+        stall_left = 0
+
+        self.active = False
+        self._state = wishboneStandardState.IDLE
+        self._stall(0)
+        self._terminate(wishboneStandardStatus.NONE)
+        # nothing to do till the master starts one.
+        await RisingEdge(self.bus.cyc)
+        continue
+
+      for response in responses:
+        response[0] -= 1
+
+      if(stall_left):
+        stall_left -= 1
+
+        if(not stall_left):
+          self._stall(0)
+      elif(self.bus.stb.value):
+        request = (self.bus.addr.value.integer, self.bus.we.value, self.bus.data_i.value, self.bus.sel.value.integer)
+
+        waited = self._waits()
+
+        responses.append([waited + self.latency - 1, request, waited])
+
+        if(waited):
+          stall_left = waited
+          self._stall(1)
+
+      self.active = bool(responses)
+      self._state = wishboneStandardState.ACTIVE if responses else wishboneStandardState.IDLE
+
+      if(not responses or responses[0][0] > 0):
+        self._terminate(wishboneStandardStatus.NONE)
+        continue
+
+      left, request, waited = responses.popleft()
+
+      status = self._serve(*request)
+
+      if(self._stats is not None):
+        self._stats.record(request[1], request[3], status, waited + self.latency)
@@ -56,6 +56,31 @@
 
 from ..version import __version__
 
-from .driver import wishboneStandardMaster, wishboneStandardEchoSlave
+from .absbus import wishboneStandardTrans, wishboneStandardTransPool, wishboneStandardStatus, wishboneStandardPolicy
+from .absbus import wishboneStandardArbitration, wishboneStandardAccess
+
+from .driver import wishboneStandardMaster, wishboneStandardHandle, wishboneStandardSlave, wishboneStandardEchoSlave
+
+from .memory import wishboneStandardMemory, wishboneStandardMemorySlave
+
+from .callback import wishboneStandardCallbackSlave, wishboneStandardRange
+
+from .profile import wishboneStandardWaitFixed, wishboneStandardWaitRandom, wishboneStandardWaitTrace, wishboneStandardFaults
 
 from .monitor import wishboneStandardMonitor
+
+from .scoreboard import wishboneStandardScoreboard
+
+from .scheduler import wishboneStandardScheduler
+
+from .coverage import wishboneStandardCoverage
+
+from .generator import wishboneStandardGenerator
+
+from .trace import wishboneStandardTraceWriter, wishboneStandardTraceReader
+
+from .replay import wishboneStandardReplay
+
+from .model import wishboneStandardModelMaster
+
+from .interconnect import wishboneStandardInterconnect, wishboneStandardInterconnectPort
@@ -33,23 +33,240 @@
 
 import cocotb
 
+from cocotb.triggers import RisingEdge
+from cocotb.utils import get_sim_time
+
 from cocotbext.busbase import *
 
 import enum
+import sys
+
+from array import array
+from collections import Counter
+
+# Variable: _typecodes
+# array typecode for each word size in bytes the platform has one for.
+_typecodes = {array(code).itemsize: code for code in "BHILQ"}
+
+# Function: _pack
+# Split buffer into a list of words of width bytes in byteorder. Word sizes array has a
+# typecode for are converted in one go, wider words one int.from_bytes per word.
+def _pack(buffer, width, byteorder="little"):
+  if(len(buffer) % width):
+    raise ValueError(f"Buffer length {len(buffer)} is not a multiple of {width} bytes.")
+
+  code = _typecodes.get(width)
+
+  if(code is not None):
+    words = array(code)
+    words.frombytes(buffer)
+    if(byteorder != sys.byteorder):
+      words.byteswap()
+    return words.tolist()
+
+  view = memoryview(buffer)
+
+  return [int.from_bytes(view[i:i+width], byteorder) for i in range(0, len(view), width)]
+
+# Function: _unpack
+# Join a list of words of width bytes in byteorder into bytes, the reverse of _pack.
+def _unpack(words, width, byteorder="little"):
+  code = _typecodes.get(width)
+
+  if(code is not None):
+    words = array(code, words)
+    if(byteorder != sys.byteorder):
+      words.byteswap()
+    return words.tobytes()
+
+  return b"".join(int(word).to_bytes(width, byteorder) for word in words)
 
 # Class: wishboneStandardState
 # An enum class that provides the current operation state.
 class wishboneStandardState(enum.IntEnum):
   IDLE   = 1
   ACTIVE = 2
+  WAIT   = 3
   ERROR  = 99
 
+# Class: wishboneStandardCti
+# An enum class of the cycle type identifier values used for registered feedback bursts.
+class wishboneStandardCti(enum.IntEnum):
+  CLASSIC = 0b000
+  CONST   = 0b001
+  INCR    = 0b010
+  END     = 0b111
+
+# Class: wishboneStandardBte
+# An enum class of the burst type extension values, linear or wrapping bursts.
+class wishboneStandardBte(enum.IntEnum):
+  LINEAR = 0b00
+  WRAP4  = 0b01
+  WRAP8  = 0b10
+  WRAP16 = 0b11
+
+# Class: wishboneStandardStatus
+# An enum class of how a transaction was terminated.
+class wishboneStandardStatus(enum.IntEnum):
+  NONE    = 0
+  ACK     = 1
+  ERR     = 2
+  RTY     = 3
+  TIMEOUT = 4
+
+# Class: wishboneStandardPolicy
+# An enum class of how the master picks between queued reads and writes.
+# ORDER keeps program order, READ_FIRST lets reads pass writes, ROUND_ROBIN alternates.
+class wishboneStandardPolicy(enum.IntEnum):
+  ORDER       = 0
+  READ_FIRST  = 1
+  ROUND_ROBIN = 2
+
+# Class: wishboneStandardArbitration
+# An enum class of how the interconnect picks between masters asking for the same slave.
+# PRIORITY always picks the first master added, ROUND_ROBIN picks the next one after the last granted.
+class wishboneStandardArbitration(enum.IntEnum):
+  PRIORITY    = 0
+  ROUND_ROBIN = 1
+
+# Class: wishboneStandardAccess
+# An enum class of what a callback slave address range allows. RC reads return the value and then clear it.
+class wishboneStandardAccess(enum.IntEnum):
+  RW = 0
+  RO = 1
+  WO = 2
+  RC = 3
+
 # Class: wishboneStandardTrans
-# Create an object that associates data, address
-class wishboneStandardTrans(transaction):
-    def __init__(self, address, data=None):
+# Create an object that associates data, address, byte lane select, and the burst cti/bte of the beat.
+# A sel of None selects every byte lane. owner is told when the transaction completes with
+# owner.complete(trans), None means nobody is told. we, status, start and end are filled in
+# by the master or monitor, start and end are the cycle counts when it was first driven and when it terminated.
+# retries counts the times the master sent it again after RTY, timeout is the number of cycles the
+# master waits for termination, None uses the master timeout. It does not derive from the busbase
+# transaction, so its __slots__ leave it without a per instance __dict__.
+class wishboneStandardTrans:
+    __slots__ = ("address", "data", "sel", "cti", "bte", "owner", "we", "status", "start", "end", "retries", "timeout")
+
+    def __init__(self, address, data=None, cti=wishboneStandardCti.CLASSIC, bte=wishboneStandardBte.LINEAR, sel=None, owner=None):
         self.address = address
         self.data = data
+        self.sel = sel
+        self.cti = cti
+        self.bte = bte
+        self.owner = owner
+        self.we = None
+        self.status = wishboneStandardStatus.NONE
+        self.start = None
+        self.end = None
+        self.retries = 0
+        self.timeout = None
+
+    # Function: latency
+    # Number of cycles from first driven to terminated, None if it has not terminated.
+    @property
+    def latency(self):
+        if(self.start is None or self.end is None):
+            return None
+
+        return self.end - self.start
+
+# Class: wishboneStandardTransPool
+# Free list of wishboneStandardTrans, so long runs reuse transactions instead of making new ones.
+class wishboneStandardTransPool:
+  # Constructor: __init__
+  # size is the most free transactions kept, extra ones returned are dropped.
+  def __init__(self, size=4096):
+    self.size = size
+    self._free = []
+
+  # Function: get
+  # Return a transaction setup with the arguments, same as wishboneStandardTrans.
+  def get(self, address, data=None, cti=wishboneStandardCti.CLASSIC, bte=wishboneStandardBte.LINEAR, sel=None, owner=None):
+    if(self._free):
+      trans = self._free.pop()
+      trans.__init__(address, data, cti, bte, sel, owner)
+      return trans
+
+    return wishboneStandardTrans(address, data, cti, bte, sel, owner)
+
+  # Function: put
+  # Give a transaction back to the pool, it must not be used after this.
+  def put(self, trans):
+    if(len(self._free) < self.size):
+      trans.data = None
+      trans.owner = None
+      self._free.append(trans)
+
+  def __len__(self):
+    return len(self._free)
+
+# Class: wishboneStandardStats
+# Traffic counters of one agent. Every termination counts as a read or write and in the latency
+# histogram, bytes only count for ACK. Each termination is an active cycle, the cycles before it
+# are wait cycles, and the rest of the cycles since the last reset are idle.
+class wishboneStandardStats:
+  # Constructor: __init__
+  # width is the number of bytes in a word, lane is the number of bytes per sel bit,
+  # cycle is the cycle count counting starts from.
+  def __init__(self, width, lane=1, cycle=0):
+    self.width = width
+    self.lane = lane
+    self.reset(cycle)
+
+  # Function: reset
+  # Zero every counter, counting cycles again from cycle.
+  def reset(self, cycle=0):
+    self.reads = 0
+    self.writes = 0
+    self.bytes = 0
+    self.err = 0
+    self.rty = 0
+    self.timeout = 0
+    self.active = 0
+    self.wait = 0
+    self.latency = Counter()
+    self._start = cycle
+
+  # Function: record
+  # Count one termination, sel None is every byte lane, latency is in cycles.
+  def record(self, we, sel, status, latency):
+    if(we):
+      self.writes += 1
+    else:
+      self.reads += 1
+
+    if(status == wishboneStandardStatus.ACK):
+      self.bytes += self.width if sel is None else bin(sel & ((1 << (self.width // self.lane)) - 1)).count("1") * self.lane
+    elif(status == wishboneStandardStatus.ERR):
+      self.err += 1
+    elif(status == wishboneStandardStatus.RTY):
+      self.rty += 1
+    elif(status == wishboneStandardStatus.TIMEOUT):
+      self.timeout += 1
+
+    self.active += 1
+    self.wait += max(0, latency - 1)
+    self.latency[latency] += 1
+
+  # Function: snapshot
+  # Return the counters as a dict, cycle is the current cycle count.
+  def snapshot(self, cycle):
+    cycles = cycle - self._start
+
+    return {
+      "cycles": cycles,
+      "reads": self.reads,
+      "writes": self.writes,
+      "bytes": self.bytes,
+      "err": self.err,
+      "rty": self.rty,
+      "timeout": self.timeout,
+      "active": self.active,
+      "wait": self.wait,
+      "idle": max(0, cycles - self.active - self.wait),
+      "latency": dict(sorted(self.latency.items())),
+    }
 
 # Class: wishboneStandardBase
 # abstract base class that defines Wishbone Classic signals
@@ -59,14 +276,32 @@ class wishboneStandardBase(busbase):
   _signals = ["data_o", "data_i", "addr", "ack", "sel", "we", "stb", "cyc"]
   # Variable: _optional_signals
   # List of optional signals, these will never be required but will be used if found.
-  _optional_signals = ["err", "rty"]
+  _optional_signals = ["err", "rty", "cti", "bte"]
 
   # Constructor: __init__
   # Setup defaults and call base class constructor.
-  def __init__(self, entity, name, clock, reset, *args, **kwargs):
+  # stats turns on the traffic counters, see <wishboneStandardStats>, off they cost nothing.
+  # byteorder is "little" when the byte at the lowest address is in sel lane 0, "big" when it is in the top lane.
+  # scheduler is an optional <wishboneStandardScheduler> that steps this agent instead of its own _run loop.
+  def __init__(self, entity, name, clock, reset, stats=False, byteorder="little", scheduler=None, *args, **kwargs):
 
     super().__init__(entity, name, clock, *args, **kwargs)
 
+    # widths from the signal handles, granularity is the bits per sel bit.
+    self.data_width = len(self.bus.data_o)
+    self.address_width = len(self.bus.addr)
+    self.lanes = len(self.bus.sel)
+
+    if(self.data_width not in (8, 16, 32, 64, 128, 256, 512) or self.data_width % (8 * self.lanes)):
+      raise ValueError(f"Data width {self.data_width} with {self.lanes} sel bits is not supported.")
+
+    self.granularity = self.data_width // self.lanes
+
+    if(byteorder not in ("little", "big")):
+      raise ValueError(f"byteorder must be little or big, not {byteorder}.")
+
+    self.byteorder = byteorder
+
     self._state = wishboneStandardState.IDLE
 
     self._reset = reset
@@ -78,3 +313,130 @@ class wishboneStandardBase(busbase):
     # Assign a noSignal object with a value attribute. That way if we
     # do a simple if check, rty does not exist and disables burst (value is always false).
     self._rty = getattr(self.bus, "rty", noSignal(False))
+
+    # Assign a noSignal object with a value attribute. That way if we
+    # do a simple if check, cti does not exist and every cycle is classic.
+    self._cti = getattr(self.bus, "cti", noSignal(wishboneStandardCti.CLASSIC))
+
+    # Assign a noSignal object with a value attribute. That way if we
+    # do a simple if check, bte does not exist and every burst is linear.
+    self._bte = getattr(self.bus, "bte", noSignal(wishboneStandardBte.LINEAR))
+
+    # last value written to each driven signal, keyed by id of the signal.
+    self._shadow = {}
+
+    # clock cycle count, kept from simulation time so edges slept through are still counted.
+    self._cycle = 0
+    self._period = None
+    self._last_edge = None
+
+    self._stats = wishboneStandardStats(self.data_width // 8, self.granularity // 8) if stats else None
+
+    self._scheduler = scheduler
+
+  # Function: to_bytes
+  # Return a word as bytes in bus byte order.
+  def to_bytes(self, word):
+    return int(word).to_bytes(self.data_width // 8, self.byteorder)
+
+  # Function: from_bytes
+  # Return a word from bytes in bus byte order.
+  def from_bytes(self, data):
+    return int.from_bytes(data, self.byteorder)
+
+  # Function: pack
+  # Split a bytes like buffer into a list of words, its length must be a multiple of the word size.
+  def pack(self, buffer):
+    return _pack(buffer, self.data_width // 8, self.byteorder)
+
+  # Function: unpack
+  # Join a list of words into bytes.
+  def unpack(self, words):
+    return _unpack(words, self.data_width // 8, self.byteorder)
+
+  # Function: _lane_mask
+  # Return the data bit mask of the lanes set in sel.
+  def _lane_mask(self, sel):
+    mask = 0
+    granule = (1 << self.granularity) - 1
+
+    for lane in range(self.lanes):
+      if(sel >> lane & 1):
+        mask |= granule << (self.granularity * lane)
+
+    return mask
+
+  # Function: _integer
+  # Return a sampled value as an int, None with a warning if it has X or Z bits.
+  def _integer(self, value):
+    try:
+      return int(value)
+    except ValueError:
+      self.log.warning(f'Value {value} is not resolvable to an integer.')
+      return None
+
+  # Function: stats
+  # Return a snapshot of the traffic counters, None if they are off.
+  def stats(self):
+    if(self._stats is None):
+      return None
+
+    return self._stats.snapshot(self._now())
+
+  # Function: reset_stats
+  # Zero the traffic counters.
+  def reset_stats(self):
+    if(self._stats is not None):
+      self._stats.reset(self._now())
+
+  # Function: _measure_clock
+  # Wait two rising edges to find the clock period, needed before _tick is used.
+  async def _measure_clock(self):
+    await RisingEdge(self.clock)
+    start = get_sim_time()
+    await RisingEdge(self.clock)
+    self._last_edge = get_sim_time()
+    self._period = self._last_edge - start
+
+  # Function: _tick
+  # Update the cycle count on a rising edge, counting any edges that were not waited on.
+  # Until the clock is measured every call is one cycle.
+  def _tick(self):
+    now = get_sim_time()
+
+    if(self._period is None):
+      self._cycle += 1
+    else:
+      self._cycle += max(1, round((now - self._last_edge) / self._period))
+
+    self._last_edge = now
+
+  # Function: _now
+  # Cycle count right now, including edges since the last _tick.
+  def _now(self):
+    if(self._period is None):
+      return self._cycle
+
+    return self._cycle + round((get_sim_time() - self._last_edge) / self._period)
+
+  # Function: _set
+  # Drive signal to value, only going to the simulator when the value changes.
+  def _set(self, signal, value):
+    key = id(signal)
+
+    if(key not in self._shadow or self._shadow[key] != value):
+      signal.value = value
+      self._shadow[key] = value
+
+  # Function: _burst_address
+  # Return the address of the beat after address for a burst of type bte.
+  @staticmethod
+  def _burst_address(address, bte):
+    if(bte == wishboneStandardBte.WRAP4):
+      return (address & ~0x3) | ((address + 1) & 0x3)
+    elif(bte == wishboneStandardBte.WRAP8):
+      return (address & ~0x7) | ((address + 1) & 0x7)
+    elif(bte == wishboneStandardBte.WRAP16):
+      return (address & ~0xF) | ((address + 1) & 0xF)
+
+    return address + 1
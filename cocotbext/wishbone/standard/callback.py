@@ -0,0 +1,272 @@
+#******************************************************************************
+# file:    callback.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2025/04/18
+#
+# about:   Brief
+# Wishbone Classic slave that hands address ranges to user callbacks
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+
+import bisect
+import inspect
+
+import cocotb
+
+from ..version import __version__
+from .absbus import *
+from .driver import wishboneStandardSlave
+
+# Class: wishboneStandardRange
+# One address range of a <wishboneStandardCallbackSlave>. read(offset) returns the word,
+# write(offset, data, sel) stores it, offset is from base in words. Either may be async.
+# Without a handler the range keeps its words in values. An RC range with a read handler
+# is cleared by its write handler with 0 on every lane after each read, so it needs both.
+class wishboneStandardRange:
+  __slots__ = ("base", "size", "read", "write", "access", "values", "async_read", "async_write")
+
+  def __init__(self, base, size, read=None, write=None, access=wishboneStandardAccess.RW):
+    self.base = base
+    self.size = size
+    self.read = read
+    self.write = write
+    self.access = access
+    self.values = {}
+    self.async_read = inspect.iscoroutinefunction(read)
+    self.async_write = inspect.iscoroutinefunction(write)
+
+# Class: wishboneStandardCallbackSlave
+# Slave that decodes each address to a <wishboneStandardRange> by binary search over the sorted
+# range bases. Addresses outside every range go to fallback, any model with _read and _write
+# such as <wishboneStandardMemory>, or end with ERR when there is none. The fallback _status, if it
+# has one, can end them with ERR too. With strict, writes to RO and reads from WO end with ERR,
+# otherwise the write is dropped and the read returns 0.
+# Async handlers hold the request in wait states until they return.
+class wishboneStandardCallbackSlave(wishboneStandardSlave):
+  # Constructor: __init__
+  # Setup defaults and call base class constructor.
+  def __init__(self, entity, name, clock, reset, fallback=None, strict=True, *args, **kwargs):
+    super().__init__(entity, name, clock, reset, *args, **kwargs)
+
+    self.log.info("Wishbone Classic Callback Slave version %s", __version__)
+    self.log.info("Copyright (c) 2025 Jay Convertino")
+    self.log.info("https://github.com/johnathan-convertino-afrl/cocotbext-wishbone")
+
+    self.fallback = fallback
+    self.strict = strict
+
+    # sorted range bases and their ranges, for bisect.
+    self._bases = []
+    self._ranges = []
+
+    # async handler call in flight, [address, we, done, result]. address is None once its
+    # request is gone, it then only holds off the next call till it returns.
+    self._call = None
+
+  # Function: add_range
+  # Map size words at base to the handlers, returns the <wishboneStandardRange>.
+  def add_range(self, base, size, read=None, write=None, access=wishboneStandardAccess.RW):
+    index = bisect.bisect(self._bases, base)
+
+    if(index and self._ranges[index-1].base + self._ranges[index-1].size > base):
+      raise ValueError(f"Range at {base} overlaps range at {self._ranges[index-1].base}.")
+
+    if(index < len(self._ranges) and base + size > self._ranges[index].base):
+      raise ValueError(f"Range at {base} overlaps range at {self._ranges[index].base}.")
+
+    if(access == wishboneStandardAccess.RC and read is not None and write is None):
+      raise ValueError(f"RC range at {base} with a read handler needs a write handler to clear it.")
+
+    r = wishboneStandardRange(base, size, read, write, access)
+
+    self._bases.insert(index, base)
+    self._ranges.insert(index, r)
+
+    return r
+
+  # Function: _decode
+  # Return the range address falls in, None if it is not mapped.
+  def _decode(self, address):
+    index = bisect.bisect(self._bases, address) - 1
+
+    if(index < 0):
+      return None
+
+    r = self._ranges[index]
+
+    if(address >= r.base + r.size):
+      return None
+
+    return r
+
+  # Function: _denied
+  # True if the range does not allow we.
+  def _denied(self, r, we):
+    if(we):
+      return r.access in (wishboneStandardAccess.RO, wishboneStandardAccess.RC)
+
+    return r.access == wishboneStandardAccess.WO
+
+  # Function: _status
+  # ERR for unmapped addresses without a fallback and, with strict, for access the range does not allow.
+  def _status(self, address, we):
+    r = self._decode(address)
+
+    if(r is None):
+      if(self.fallback is None):
+        return wishboneStandardStatus.ERR
+      if(hasattr(self.fallback, "_status")):
+        status = self.fallback._status(address, we)
+        if(status != wishboneStandardStatus.ACK):
+          return status
+    elif(self.strict and self._denied(r, we)):
+      return wishboneStandardStatus.ERR
+
+    return super()._status(address, we)
+
+  # Function: _serve
+  # Serve the request like the base slave, a call for a request ended with ERR or RTY is dropped.
+  def _serve(self, address, we):
+    status = super()._serve(address, we)
+
+    if(status != wishboneStandardStatus.ACK):
+      self._drop()
+
+    return status
+
+  # Function: _step
+  # Drop the call of a request the master gave up on, then step like the base slave.
+  def _step(self):
+    if(not (self.bus.cyc.value and self.bus.stb.value)):
+      self._drop()
+
+    super()._step()
+
+  # Function: _drop
+  # Forget the async handler call, one still running keeps later calls waiting till it returns.
+  def _drop(self):
+    if(self._call is None):
+      return
+
+    if(self._call[2]):
+      self._call = None
+    else:
+      self._call[0] = None
+
+  # Function: _clear
+  # Clear word offset of an RC range through its write handler, after it was read.
+  def _clear(self, r, offset):
+    result = r.write(offset, 0, (1 << self.lanes) - 1)
+
+    if(r.async_write):
+      cocotb.start_soon(result)
+
+  # Function: _ready
+  # Hold a request to an async handler till its call returns. The call is only started once the
+  # request is on the bus, not for a predicted burst address, so write data is the real data.
+  def _ready(self, address, we):
+    r = self._decode(address)
+
+    if(r is None or self._denied(r, we) or not (r.async_write if we else r.async_read)):
+      return True
+
+    if(self._call is not None and self._call[:2] == [address, we]):
+      return self._call[2]
+
+    if(self._call is not None and not self._call[2]):
+      return False
+
+    if(self.bus.addr.value.integer != address):
+      return False
+
+    if(we):
+      coro = r.write(address - r.base, self.bus.data_i.value.integer, self.bus.sel.value.integer)
+    else:
+      coro = r.read(address - r.base)
+
+    self._call = [address, we, False, None]
+
+    cocotb.start_soon(self._await(coro, self._call))
+
+    return False
+
+  # Function: _await
+  # Run an async handler call and mark it done with its result.
+  async def _await(self, coro, call):
+    call[3] = await coro
+    call[2] = True
+
+  # Function: _read
+  # Return the word at address from its range handler, its stored value or the fallback.
+  def _read(self, address):
+    r = self._decode(address)
+
+    if(r is None):
+      return self.fallback._read(address)
+
+    if(self._denied(r, 0)):
+      return 0
+
+    if(r.read is not None):
+      if(r.async_read):
+        data = self._call[3]
+        self._call = None
+      else:
+        data = r.read(address - r.base)
+
+      if(r.access == wishboneStandardAccess.RC):
+        self._clear(r, address - r.base)
+
+      return data
+
+    if(r.access == wishboneStandardAccess.RC):
+      return r.values.pop(address - r.base, 0)
+
+    return r.values.get(address - r.base, 0)
+
+  # Function: _write
+  # Hand the lanes of data set in sel at address to its range handler, stored value or the fallback.
+  def _write(self, address, data, sel):
+    r = self._decode(address)
+
+    if(r is None):
+      self.fallback._write(address, data, sel)
+      return
+
+    if(self._denied(r, 1)):
+      return
+
+    if(r.async_write):
+      self._call = None
+      return
+
+    if(r.write is not None):
+      r.write(address - r.base, int(data), sel)
+      return
+
+    mask = self._lane_mask(sel)
+
+    r.values[address - r.base] = (r.values.get(address - r.base, 0) & ~mask) | (int(data) & mask)
@@ -0,0 +1,171 @@
+#******************************************************************************
+# file:    coverage.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2025/04/18
+#
+# about:   Brief
+# Functional coverage bins for Wishbone Classic transfers
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+
+import itertools
+
+from .absbus import *
+
+# Class: wishboneStandardCoverage
+# Functional coverage of terminated transfers, give it to the monitor with coverage= to sample
+# every transfer. Each cover point maps a transfer to a bin, a cross counts combinations of the
+# bins of its points. Coverage is closed once every bin has been hit goal times.
+class wishboneStandardCoverage:
+  # Constructor: __init__
+  # goal is how many hits each bin needs unless its point says otherwise.
+  def __init__(self, goal=1):
+    self.goal = goal
+
+    # name : (sample, bins, goal, hits)
+    self._points = {}
+    # name : (points, bins, goal, hits)
+    self._crosses = {}
+
+    # bins still under their goal, so done() does not walk every bin.
+    self._open = 0
+
+  # Function: add_point
+  # Add a cover point, sample(trans) returns the bin of the transfer or None to skip it.
+  # Values outside bins are not counted.
+  def add_point(self, name, sample, bins, goal=None):
+    hits = dict.fromkeys(bins, 0)
+
+    self._points[name] = (sample, hits, self.goal if goal is None else goal)
+    self._open += len(hits)
+
+  # Function: add_cross
+  # Add a cross of the bins of already added points. A transfer only counts when all points hit a bin.
+  def add_cross(self, name, *points, goal=None):
+    hits = dict.fromkeys(itertools.product(*(self._points[p][1] for p in points)), 0)
+
+    self._crosses[name] = (points, hits, self.goal if goal is None else goal)
+    self._open += len(hits)
+
+  # Function: add_direction
+  # Cover point of reads and writes.
+  def add_direction(self, name="we", goal=None):
+    self.add_point(name, lambda trans: trans.we, (0, 1), goal)
+
+  # Function: add_address
+  # Cover point of count equal address bins from low to high, inclusive.
+  def add_address(self, low, high, count=16, name="address", goal=None):
+    span = high - low + 1
+
+    def sample(trans):
+      if(trans.address < low or trans.address > high):
+        return None
+      return (trans.address - low) * count // span
+
+    self.add_point(name, sample, range(count), goal)
+
+  # Function: add_sel
+  # Cover point of the sel patterns of writes.
+  def add_sel(self, patterns, name="sel", goal=None):
+    self.add_point(name, lambda trans: trans.sel if trans.we else None, patterns, goal)
+
+  # Function: add_burst
+  # Cover point of burst lengths, a single transfer is length 1. Only the last beat is counted.
+  # A beat that is not ACKed ends the cycle, so the burst is dropped and not counted.
+  def add_burst(self, lengths, name="burst", goal=None):
+    beats = [0]
+
+    def sample(trans):
+      if(trans.status != wishboneStandardStatus.ACK):
+        beats[0] = 0
+        return None
+      beats[0] += 1
+      if(trans.cti in (wishboneStandardCti.CONST, wishboneStandardCti.INCR)):
+        return None
+      length = beats[0]
+      beats[0] = 0
+      return length
+
+    self.add_point(name, sample, lengths, goal)
+
+  # Function: add_status
+  # Cover point of how transfers were terminated.
+  def add_status(self, statuses=(wishboneStandardStatus.ACK, wishboneStandardStatus.ERR, wishboneStandardStatus.RTY), name="status", goal=None):
+    self.add_point(name, lambda trans: trans.status, statuses, goal)
+
+  # Function: sample
+  # Count a terminated transfer in every point and cross.
+  def sample(self, trans):
+    values = {}
+
+    for name, (sample, hits, goal) in self._points.items():
+      value = sample(trans)
+      values[name] = value
+
+      if(value in hits):
+        hits[value] += 1
+        if(hits[value] == goal):
+          self._open -= 1
+
+    for name, (points, hits, goal) in self._crosses.items():
+      key = tuple(values[p] for p in points)
+
+      if(key in hits):
+        hits[key] += 1
+        if(hits[key] == goal):
+          self._open -= 1
+
+  # Function: done
+  # True once every bin has reached its goal.
+  def done(self):
+    return self._open <= 0
+
+  # Function: coverage
+  # Fraction of bins that reached their goal, 1.0 with no bins.
+  def coverage(self):
+    total = sum(len(hits) for _, hits, _ in itertools.chain(self._points.values(), self._crosses.values()))
+
+    if(not total):
+      return 1.0
+
+    return (total - self._open) / total
+
+  # Function: holes
+  # Dict of point and cross names to the bins still under their goal.
+  def holes(self):
+    result = {}
+
+    for name, (_, hits, goal) in itertools.chain(self._points.items(), self._crosses.items()):
+      missing = [value for value, count in hits.items() if count < goal]
+      if(missing):
+        result[name] = missing
+
+    return result
+
+  # Function: report
+  # Dict of point and cross names to a copy of their bin hit counts.
+  def report(self):
+    return {name: dict(hits) for name, (_, hits, _) in itertools.chain(self._points.items(), self._crosses.items())}
@@ -33,18 +33,187 @@
 
 from ..version import __version__
 from .absbus import *
+from .profile import wishboneStandardWaitFixed
+
+from collections import deque
+
+import cocotb
 
 from cocotb.triggers import FallingEdge, RisingEdge, Event
 from cocotb.result import TestFailure
 from cocotb.binary import BinaryValue
 from cocotb.queue import Queue
 
+# Class: wishboneStandardHandle
+# Future like handle of a read or write queued on the master. Await it, or its wait method,
+# for the result. Reads give the data, or a list of data for a list of addresses.
+class wishboneStandardHandle:
+  # Constructor: __init__
+  # we is 1 for writes 0 for reads, trans is the list of transactions to send.
+  # single is True if the result is one value instead of a list.
+  def __init__(self, we, trans, single=False):
+    self.we = we
+    self.trans = trans
+    self.event = Event()
+
+    self._single = single
+    self._remaining = len(trans)
+
+    for t in trans:
+      t.owner = self
+
+    if(not self._remaining):
+      self.event.set()
+
+  def __iter__(self):
+    return iter(self.trans)
+
+  def __await__(self):
+    return self.wait().__await__()
+
+  # Function: done
+  # True once every transaction of the handle has terminated.
+  def done(self):
+    return self.event.is_set()
+
+  # Function: status
+  # How the transactions of the handle were terminated, one status or a list of them.
+  def status(self):
+    if(self._single):
+      return self.trans[0].status
+
+    return [t.status for t in self.trans]
+
+  # Function: result
+  # Read data of the handle, None for writes.
+  def result(self):
+    if(self.we):
+      return None
+
+    if(self._single):
+      return self.trans[0].data
+
+    return [t.data for t in self.trans]
+
+  # Function: wait
+  # Wait for the handle to finish and return the result.
+  async def wait(self):
+    if(not self.event.is_set()):
+      await self.event.wait()
+
+    return self.result()
+
+  # Function: complete
+  # Called by the master when a transaction of the handle has terminated.
+  def complete(self, trans):
+    self._remaining -= 1
+
+    if(not self._remaining):
+      self.event.set()
+
+# Class: wishboneStandardByteStream
+# A byte range moved over the bus as one incrementing burst. Words are made as the master
+# asks for them, and read words are packed straight into a preallocated buffer.
+class wishboneStandardByteStream(wishboneStandardHandle):
+  # Constructor: __init__
+  # address is a byte address, width is the number of bytes in a word, data is None for a read.
+  # pool is an optional wishboneStandardTransPool the word transactions come from and go back to.
+  # lane is the number of bytes per sel bit, address and length must be multiples of it.
+  # byteorder says which end of the word the lowest byte address is in.
+  def __init__(self, address, length, width, data=None, pool=None, lane=1, byteorder="little"):
+    if(address % lane or length % lane):
+      raise ValueError(f"Byte address and length must be multiples of the {lane} byte granularity.")
+
+    self.buffer = bytearray(length) if data is None else memoryview(data)
+    self.address = address
+    self.length = length
+
+    self._width = width
+    self._lane = lane
+    self._byteorder = byteorder
+    self._pool = pool
+    self._first = address // width
+    self._last = (address + length - 1) // width
+
+    super().__init__(int(data is not None), [])
+
+    if(length):
+      self._remaining = self._last - self._first + 1
+      self.event.clear()
+
+  def __iter__(self):
+    return self._generate()
+
+  # Function: result
+  # The bytes read, None for writes.
+  def result(self):
+    if(self.we):
+      return None
+
+    return self.buffer
+
+  # Function: _generate
+  # Yield a transaction per word in the range, lanes outside of the range are not selected.
+  def _generate(self):
+    if(not self.length):
+      return
+
+    width = self._width
+
+    for word in range(self._first, self._last + 1):
+      start = word * width - self.address
+      lo = max(-start, 0)
+      hi = min(self.length - start, width)
+
+      # bit position of the lowest selected byte in the word.
+      shift = lo if self._byteorder == "little" else width - hi
+
+      data = None
+      if(self.we):
+        data = int.from_bytes(self.buffer[start+lo:start+hi], self._byteorder) << (8 * shift)
+
+      if(self._first == self._last):
+        cti = wishboneStandardCti.CLASSIC
+      elif(word == self._last):
+        cti = wishboneStandardCti.END
+      else:
+        cti = wishboneStandardCti.INCR
+
+      sel = ((1 << ((hi - lo) // self._lane)) - 1) << (shift // self._lane)
+
+      if(self._pool is None):
+        yield wishboneStandardTrans(word, data, cti, wishboneStandardBte.LINEAR, sel, self)
+      else:
+        yield self._pool.get(word, data, cti, wishboneStandardBte.LINEAR, sel, self)
+
+  # Function: complete
+  # Called by the master when a word is done, read data is copied into the buffer.
+  # Unresolved read data, None, leaves the bytes of that word as they were.
+  def complete(self, trans):
+    if(not self.we and trans.data is not None):
+      start = trans.address * self._width - self.address
+      lo = max(-start, 0)
+      hi = min(self.length - start, self._width)
+      self.buffer[start+lo:start+hi] = int(trans.data).to_bytes(self._width, self._byteorder)[lo:hi]
+
+    if(self._pool is not None):
+      self._pool.put(trans)
+
+    super().complete(trans)
+
 # Class: wishboneStandardMaster
-# Drive slave devices over the Wishbone Classic bus
+# Drive slave devices over the Wishbone Classic bus. Reads and writes go into one command queue,
+# and policy picks which goes next, see <wishboneStandardPolicy>. ACK, ERR and RTY all terminate a
+# transfer, ERR and timeouts end the cycle. RTY ends the cycle and the transfer is sent again after
+# backoff cycles, up to retries times, before it is given up with a RTY status.
 class wishboneStandardMaster(wishboneStandardBase):
   # Constructor: __init__
-  # Setup defaults and call base class constructor.
-  def __init__(self, entity, name, clock, reset, *args, **kwargs):
+  # Setup defaults and call base class constructor. pool is an optional wishboneStandardTransPool
+  # that read, write and the byte methods take their transactions from. backoff is a number of
+  # cycles, or a function of the retry count that returns one. timeout is the number of cycles to
+  # wait for termination before giving up, None waits forever.
+  def __init__(self, entity, name, clock, reset, pool=None, policy=wishboneStandardPolicy.ORDER,
+               retries=16, backoff=1, timeout=None, *args, **kwargs):
     super().__init__(entity, name, clock, reset, *args, **kwargs)
 
     self.log.info("Wishbone Classic Master version %s", __version__)
@@ -58,33 +227,132 @@ class wishboneStandardMaster(wishboneStandardBase):
     self.bus.stb.setimmediatevalue(0)
     self.bus.cyc.setimmediatevalue(0)
 
+    if hasattr(self.bus, "cti"):
+      self.bus.cti.setimmediatevalue(0)
+
+    if hasattr(self.bus, "bte"):
+      self.bus.bte.setimmediatevalue(0)
+
+    # bytes in a word and bytes per sel bit.
+    self._width = self.data_width // 8
+    self._lane = self.granularity // 8
+
+    # sel with every lane selected.
+    self._full = (1 << self.lanes) - 1
+
+    self.policy = policy
+
+    self.retries = retries
+    self.backoff = backoff
+    self.timeout = timeout
+
+    # queued handles for writes and reads, each with a sequence number for program order.
+    self._commands = {1: deque(), 0: deque()}
+    self._sequence = 0
+
+    # handle being sent and the type of the last handle picked, for round robin.
+    self._current = None
+    self._last_we = 0
+
+    self._pool = pool
+
+    self._new_trans = wishboneStandardTrans if pool is None else pool.get
+
+    # set when work is queued, _run waits on it instead of every edge when there is nothing to do.
+    self._wake = Event()
+
   # Function: read
-  # Read from a address and return data
+  # Read from a address and return data. A list of contiguous addresses is read as a burst.
   async def read(self, address):
-    trans = None
+    handle = self.issue_read(address)
+    data = await handle
+    self.release(handle)
+    return data
+
+  # Function: write
+  # Write to a address some data. A list of contiguous addresses is written as a burst.
+  # sel is the byte lane mask for every word, None writes all lanes.
+  async def write(self, address, data, sel=None):
+    handle = self.issue_write(address, data, sel)
+    await handle
+    self.release(handle)
+
+  # Function: issue_read
+  # Queue a read of a address, or list of addresses, and return its <wishboneStandardHandle>
+  # without waiting. Await the handle for the data.
+  def issue_read(self, address):
     if(isinstance(address, list)):
       temp = []
       for a in address:
-        temp.append(wishboneStandardTrans(a))
-      temp = await self.read_trans(temp)
-      #need a return with the data list only. This is only a guess at this point
-      return [temp[i].data for i in range(len(temp))]
-    else:
-      trans = await self.read_trans(wishboneStandardTrans(address))
-      return trans.data
+        temp.append(self._new_trans(a))
+      self._mark_bursts(temp)
+      return self._submit(wishboneStandardHandle(0, temp))
 
-  # Function: write
-  # Write to a address some data
-  async def write(self, address, data):
+    return self._submit(wishboneStandardHandle(0, [self._new_trans(address)], True))
+
+  # Function: issue_write
+  # Queue a write of some data to a address, or lists of them, and return its
+  # <wishboneStandardHandle> without waiting.
+  def issue_write(self, address, data, sel=None):
     if(isinstance(address, list) or isinstance(data, list)):
       if(len(address) != len(data)):
         self.log.error(f'Address and data vector must be the same length')
       temp = []
       for i in range(len(address)):
-        temp.append(wishboneStandardTrans(address[i], data[i]))
-      await self.write_trans(temp)
+        temp.append(self._new_trans(address[i], data[i], sel=sel))
+      self._mark_bursts(temp)
+      return self._submit(wishboneStandardHandle(1, temp))
+
+    return self._submit(wishboneStandardHandle(1, [self._new_trans(address, data, sel=sel)], True))
+
+  # Function: read_bytes
+  # Read length bytes starting at a byte address, returned as a bytearray.
+  # Words are made as they go out on the bus, as one burst.
+  async def read_bytes(self, address, length):
+    return await self._submit(wishboneStandardByteStream(address, length, self._width, None, self._pool, self._lane, self.byteorder))
+
+  # Function: write_bytes
+  # Write bytes starting at a byte address. The bytes are split into aligned words as they go
+  # out on the bus, as one burst, with sel masking off the lanes of partial words at either end.
+  async def write_bytes(self, address, data):
+    await self._submit(wishboneStandardByteStream(address, len(data), self._width, data, self._pool, self._lane, self.byteorder))
+
+  # Function: read_trans
+  # Read a transaction, or list of them, through the command queue. Returns them with data filled in.
+  async def read_trans(self, trans):
+    if(isinstance(trans, list)):
+      if(not all(self._check_type(t) for t in trans)):
+        return None
+      await self._submit(wishboneStandardHandle(0, trans))
     else:
-      await self.write_trans(wishboneStandardTrans(address, data))
+      if(not self._check_type(trans)):
+        return None
+      await self._submit(wishboneStandardHandle(0, [trans], True))
+
+    return trans
+
+  # Function: write_trans
+  # Write a transaction, or list of them, through the command queue.
+  async def write_trans(self, trans):
+    if(isinstance(trans, list)):
+      if(not all(self._check_type(t) for t in trans)):
+        return
+      await self._submit(wishboneStandardHandle(1, trans))
+    else:
+      if(not self._check_type(trans)):
+        return
+      await self._submit(wishboneStandardHandle(1, [trans], True))
+
+  # Function: _submit
+  # Put a handle on the command queue and wake up _run.
+  def _submit(self, handle):
+    if(not handle.done()):
+      self._commands[handle.we].append((self._sequence, handle))
+      self._sequence += 1
+      (self._idle_write if handle.we else self._idle_read).clear()
+      self._wake.set()
+
+    return handle
 
   # Function: _check_type
   # Check and make sure we are only sending 2 bytes at a time and that it is a bytes/bytearray
@@ -95,137 +363,368 @@ class wishboneStandardMaster(wishboneStandardBase):
 
       return True
 
+  # Function: release
+  # Give the transactions of a handle from issue_read or issue_write back to the pool, if there
+  # is one, once its result has been read. The handle must not be used after. Byte streams give
+  # their words back as they complete, so releasing them does nothing.
+  def release(self, handle):
+    self._release(handle.trans)
+
+  # Function: _release
+  # Give transactions made by read or write back to the pool, if there is one.
+  # Only terminated transactions are returned, anything still queued is left alone.
+  def _release(self, trans):
+    if(self._pool is None):
+      return
+
+    for t in trans:
+      if(t.status != wishboneStandardStatus.NONE):
+        self._pool.put(t)
+
+  # Function: _mark_bursts
+  # Find runs of contiguous addresses in a transaction list and set their cti/bte so they
+  # go out as incrementing bursts. A run of 4, 8, or 16 that starts unaligned and wraps
+  # inside its block is sent as a wrapping burst.
+  def _mark_bursts(self, trans):
+    i = 0
+
+    while i < len(trans):
+      length = 1
+      bte = wishboneStandardBte.LINEAR
+
+      for size, wrap in ((4, wishboneStandardBte.WRAP4), (8, wishboneStandardBte.WRAP8), (16, wishboneStandardBte.WRAP16)):
+        if(i + size > len(trans) or not trans[i].address % size):
+          continue
+
+        if all(trans[i+k+1].address == self._burst_address(trans[i+k].address, wrap) for k in range(size-1)):
+          length = size
+          bte = wrap
+          break
+
+      if(length == 1):
+        while(i + length < len(trans) and trans[i+length].address == trans[i+length-1].address + 1):
+          length += 1
+
+      if(length > 1):
+        for t in trans[i:i+length-1]:
+          t.cti = wishboneStandardCti.INCR
+          t.bte = bte
+
+        trans[i+length-1].cti = wishboneStandardCti.END
+        trans[i+length-1].bte = bte
+
+      i += length
+
+  # Function: _drive
+  # Put a transaction on the bus, we selects a write or a read.
+  def _drive(self, trans, we):
+    self._set(self.bus.sel, self._full if trans.sel is None else trans.sel)
+    self._set(self.bus.addr, trans.address)
+    if(we):
+      self._set(self.bus.data_i, trans.data)
+    self._set(self.bus.we, we)
+    self._set(self._cti, trans.cti)
+    self._set(self._bte, trans.bte)
+    self._set(self.bus.stb, 1)
+    self._set(self.bus.cyc, 1)
+
+    trans.we = we
+
+    if(trans.start is None):
+      trans.start = self._cycle
+
+  # Function: _idle
+  # Take the master off the bus, all outputs to zero.
+  def _idle(self):
+    self._set(self.bus.we, 0)
+    self._set(self.bus.addr, 0)
+    self._set(self.bus.data_i, 0)
+    self._set(self.bus.sel, 0)
+    self._set(self._cti, 0)
+    self._set(self._bte, 0)
+    self._set(self.bus.stb, 0)
+    self._set(self.bus.cyc, 0)
+
+  # Function: _pending
+  # True if there are any queued writes or reads.
+  def _pending(self):
+    return self._current is not None or bool(self._commands[1]) or bool(self._commands[0])
+
+  # Function: _sleep
+  # Nothing to do, wait for work to be queued instead of waking up every edge.
+  async def _sleep(self):
+    self._wake.clear()
+
+    if(not self._pending()):
+      await self._wake.wait()
+
+  # Function: _drained
+  # Set the idle event of we once no transfers of that type are left in the command queue.
+  def _drained(self, we):
+    if(self._commands[we] or (self._current is not None and self._last_we == we)):
+      return
+
+    (self._idle_write if we else self._idle_read).set()
+
+  # Function: _select
+  # Return the type of the handle the policy picks next, 1 for write 0 for read, None if none are queued.
+  def _select(self):
+    writes = self._commands[1]
+    reads = self._commands[0]
+
+    if(not writes):
+      return 0 if reads else None
+
+    if(not reads):
+      return 1
+
+    if(self.policy == wishboneStandardPolicy.READ_FIRST):
+      return 0
+
+    if(self.policy == wishboneStandardPolicy.ROUND_ROBIN):
+      return int(not self._last_we)
+
+    return int(writes[0][0] < reads[0][0])
+
+  # Function: _next
+  # Return the next transaction, with its we set, None if there is nothing to do.
+  # A handle is sent to the end before the next is picked. If we is given only a
+  # transaction of that type is returned, so a cycle never mixes reads and writes.
+  def _next(self, we=None):
+    while True:
+      if(self._current is not None):
+        trans = next(self._current, None)
+        if(trans is not None):
+          trans.we = self._last_we
+          return trans
+        self._current = None
+
+      select = self._select()
+
+      if(select is None or (we is not None and select != we)):
+        return None
+
+      self._current = iter(self._commands[select].popleft()[1])
+      self._last_we = select
+
+  # Function: _termination
+  # Return how the slave terminated the current transfer, NONE if it has not.
+  def _termination(self):
+    if(self.bus.ack.value):
+      return wishboneStandardStatus.ACK
+
+    if(self._err.value):
+      return wishboneStandardStatus.ERR
+
+    if(self._rty.value):
+      return wishboneStandardStatus.RTY
+
+    return wishboneStandardStatus.NONE
+
+  # Function: _backoff
+  # Number of cycles to wait before sending a transaction again after RTY, at least one.
+  def _backoff(self, retries):
+    if(callable(self.backoff)):
+      return max(1, self.backoff(retries))
+
+    return max(1, self.backoff)
+
+  # Function: _timeout
+  # Number of cycles to wait for trans to be terminated, None waits forever.
+  def _timeout(self, trans):
+    return self.timeout if trans.timeout is None else trans.timeout
+
+  # Function: _complete
+  # A transaction was terminated, capture read data and hand it to its owner.
+  # latency is the cycles this attempt took, None is from when it was first driven.
+  def _complete(self, trans, we, status=wishboneStandardStatus.ACK, latency=None):
+    if(not we):
+      trans.data = self._integer(self.bus.data_o.value)
+
+    trans.status = status
+    trans.end = self._cycle
+
+    if(self._stats is not None):
+      self._stats.record(we, trans.sel, status, trans.latency if latency is None else latency)
+
+    if(status != wishboneStandardStatus.ACK):
+      self.log.warning(f'Transfer to address {trans.address} terminated with {status.name}')
+
+    if(trans.owner is not None):
+      trans.owner.complete(trans)
+
+  # Function: _busy
+  # True if _step has anything to do this edge, a transfer on the bus or work queued.
+  def _busy(self):
+    return self._state != wishboneStandardState.IDLE or self._pending()
+
   # Method: _run
-  # _run thread that deals with read and write queues.
+  # _run thread that deals with the command queue, one _step per rising edge. With a
+  # scheduler the master is stepped by it instead and this only adds the master to it.
   async def _run(self):
     self.active = False
 
-    trans = None
+    self._trans = None
+    self._we = 0
+
+    # cycle the current transfer was driven on, for timeouts.
+    self._issued = 0
+
+    # cycles left to wait before sending a transfer again after RTY.
+    self._retry_wait = 0
+
+    if(self._scheduler is not None):
+      self._scheduler.add(self)
+      return
+
+    await self._measure_clock()
 
     while True:
       await RisingEdge(self.clock)
 
-      # when in reset, set values and idle.
-      if self._reset.value:
-        self.bus.sel.value = 0
-        self.bus.data_i.value = 0
-        self.bus.addr.value = 0
-        self.bus.we.value = 0
-        self.bus.stb.value = 0
-        self.bus.cyc.value = 0
-        continue
-
-      # write queue is not empty, we need to write that data.
-      if not self.wqueue.empty():
-        self.active = True
-        #keep in active loop
-        while self.active:
-          if(self._state == wishboneStandardState.IDLE):
-            trans = await self.wqueue.get()
-            self.bus.sel.value = ~0
-            self.bus.addr.value = trans.address
-            self.bus.data_i.value = trans.data
-            self.bus.we.value = 1
-            self.bus.stb.value = 1
-            self.bus.cyc.value = 1
-            self._state = wishboneStandardState.ACTIVE
-          elif(self._state == wishboneStandardState.ACTIVE):
-            if(self.wqueue.empty() and self.bus.ack.value):
-              self.bus.stb.value = 0
-              self.bus.sel.value = 0
-              self.bus.addr.value = 0
-              self.bus.data_i.value = 0
-              self.bus.we.value = 0
-              self.bus.stb.value = 0
-              self.bus.cyc.value = 0
-              self._idle_write.set()
-              self.active = False
-              self._state = wishboneStandardState.IDLE
-            elif(self.bus.ack.value):
-              trans = await self.wqueue.get()
-              self.bus.sel.value = ~0
-              self.bus.addr.value = trans.address
-              self.bus.data_i.value = trans.data
-              self.bus.we.value = 1
-              self.bus.stb.value = 1
-              self.bus.cyc.value = 1
-              self._idle_write.set()
-
-          #all operations are done on rising edge of clock
-          await RisingEdge(self.clock)
-
-      # request queue is not empty, do a read.
-      elif not self.qqueue.empty():
-        self.active = True
-        #keep in active loop
-        while self.active:
-          if(self._state == wishboneStandardState.IDLE):
-            trans = await self.qqueue.get()
-            self.bus.sel.value = ~0
-            self.bus.addr.value = trans.address
-            self.bus.we.value = 0
-            self.bus.stb.value = 1
-            self.bus.cyc.value = 1
-            self._idle_read.set()
-            self._state = wishboneStandardState.ACTIVE
-          elif(self._state == wishboneStandardState.ACTIVE):
-            # queue is empty and we are ready, time to go to idle.wishboneClassic
-            if(self.qqueue.empty() and self.bus.ack.value):
-              trans.data = self.bus.data_o.value
-              await self.rqueue.put(trans)
-              self.bus.sel.value = 0
-              self.bus.stb.value = 0
-              self.bus.cyc.value = 0
-              self.bus.addr.value = 0
-              self._state = wishboneStandardState.IDLE
-              self.active = False
-              self._idle_read.set()
-            # acked and not empty, lets idle the active thread.
-            elif(self.bus.ack.value):
-              trans.data = self.bus.data_o.value
-              await self.rqueue.put(trans)
-              trans = await self.qqueue.get()
-              self.bus.sel.value = ~0
-              self.bus.we.value = 0
-              self.bus.addr.value = trans.address
-              self.bus.stb.value = 1
-              self.bus.cyc.value = 1
-              self._idle_read.set()
-
-          # all operations happen on positive edge
-          await RisingEdge(self.clock)
+      self._step()
+
+      # nothing in the command queue, wait for work.
+      if(not self._busy()):
+        await self._sleep()
+
+  # Function: _step
+  # Work done on each rising edge. The cycle is held while the next transaction is the same type.
+  def _step(self):
+    self._tick()
+
+    # when in reset, set values and idle.
+    if self._reset.value:
+      self._idle()
+      self._trans = None
+      self.active = False
+      self._state = wishboneStandardState.IDLE
+      return
+
+    if(self._state == wishboneStandardState.WAIT):
+      self._retry_wait -= 1
+
+      if(not self._retry_wait):
+        self._drive(self._trans, self._we)
+        self._issued = self._cycle
+        self._state = wishboneStandardState.ACTIVE
+
+      return
+
+    if(self._state == wishboneStandardState.ACTIVE):
+      trans = self._trans
+      we = self._we
+
+      status = self._termination()
+
+      if(status == wishboneStandardStatus.NONE):
+        timeout = self._timeout(trans)
 
+        if(timeout is None or self._cycle - self._issued < timeout):
+          return
+
+        status = wishboneStandardStatus.TIMEOUT
+
+      # end the cycle and send it again later.
+      if(status == wishboneStandardStatus.RTY and trans.retries < self.retries):
+        if(self._stats is not None):
+          self._stats.record(we, trans.sel, status, self._cycle - self._issued)
+
+        trans.retries += 1
+        self._retry_wait = self._backoff(trans.retries)
+        self._idle()
+        self._state = wishboneStandardState.WAIT
+        return
+
+      self._complete(trans, we, status, self._cycle - self._issued)
+
+      trans = None
+
+      # errors end the cycle, anything left goes out in a new one.
+      if(status == wishboneStandardStatus.ACK):
+        trans = self._next(we)
+
+      self._trans = trans
+
+      if(trans is None):
+        self._idle()
+        self.active = False
+        self._state = wishboneStandardState.IDLE
+        self._drained(we)
       else:
-        # nothing in the queues, idle and set all values to zero
-        self.bus.we.value = 0
-        self.bus.addr.value = 0
-        self.bus.data_i.value = 0
-        self.bus.sel.value = 0
-        self.bus.stb.value = 0
-        self.bus.cyc.value = 0
+        self._drive(trans, we)
+        self._issued = self._cycle
 
+      return
 
+    trans = self._next()
 
-# Class: wishboneStandardEchoSlave
-# Respond to master reads and write by returning data, simple echo core.
-class wishboneStandardEchoSlave(wishboneStandardBase):
+    if(trans is None):
+      # nothing in the command queue, idle and set all values to zero.
+      self._idle()
+      self._drained(1)
+      self._drained(0)
+      return
+
+    self._trans = trans
+    self._we = trans.we
+    self.active = True
+    self._drive(trans, self._we)
+    self._issued = self._cycle
+    self._state = wishboneStandardState.ACTIVE
+
+
+
+# Class: wishboneStandardSlave
+# Base of the slave models. Runs the bus side and leaves storage to the _read and _write methods.
+# Registered feedback bursts (CTI incrementing) are ACKed every cycle. wait is the number of wait
+# states before each termination, or an iterator of them such as the profiles in profile.py.
+# faults is an optional <wishboneStandardFaults> that picks transfers to end with ERR or RTY.
+# asynchronous terminates in the same cycle STB is seen, like a slave with a combinational ACK,
+# so consecutive single transfers are ACKed every cycle, not every other one.
+class wishboneStandardSlave(wishboneStandardBase):
   # Constructor: __init__
   # Setup defaults and call base class constructor.
-  def __init__(self, entity, name, clock, reset, numreg=256, *args, **kwargs):
+  def __init__(self, entity, name, clock, reset, wait=0, faults=None, asynchronous=False, *args, **kwargs):
     super().__init__(entity, name, clock, reset, *args, **kwargs)
 
-    self.log.info("Wishbone Classic Echo Slave version %s", __version__)
-    self.log.info("Copyright (c) 2025 Jay Convertino")
-    self.log.info("https://github.com/johnathan-convertino-afrl/cocotbext-wishbone")
-
-    self.bus.err.setimmediatevalue(0)
     self.bus.data_o.setimmediatevalue(0)
     self.bus.ack.setimmediatevalue(0)
 
-    self._registers = {}
+    if hasattr(self.bus, "err"):
+      self.bus.err.setimmediatevalue(0)
 
-    for i in range(numreg):
-      self._registers[i] = 0
+    if hasattr(self.bus, "rty"):
+      self.bus.rty.setimmediatevalue(0)
+
+    self.wait = wait
+
+    self.faults = faults
+
+    self.asynchronous = asynchronous
+
+  # Function: wait
+  # Wait states before each termination, a number or an iterator of them. Can be changed between transfers.
+  @property
+  def wait(self):
+    return self._wait
+
+  @wait.setter
+  def wait(self, wait):
+    if(isinstance(wait, int)):
+      wait = wishboneStandardWaitFixed(wait) if wait else None
+
+    self._wait = wait
+
+  # Function: faults
+  # <wishboneStandardFaults> that picks transfers to end with ERR or RTY, None ACKs every transfer.
+  @property
+  def faults(self):
+    return self._faults
+
+  @faults.setter
+  def faults(self, faults):
+    self._faults = faults
 
   # Function: _check_type
   # Check and make sure we are only sending a type of wishboneStandardTrans.
@@ -236,49 +735,278 @@ class wishboneStandardEchoSlave(wishboneStandardBase):
 
       return True
 
+  # Function: _read
+  # Return the word stored at address, must be implemented by the slave model.
+  def _read(self, address):
+    raise NotImplementedError
+
+  # Function: _write
+  # Store data at address for the byte lanes set in sel, must be implemented by the slave model.
+  def _write(self, address, data, sel):
+    raise NotImplementedError
+
+  # Function: _waits
+  # Number of wait states for the next transfer.
+  def _waits(self):
+    if(self._wait is None):
+      return 0
+
+    return next(self._wait)
+
+  # Function: _status
+  # How the transfer to address will be terminated.
+  def _status(self, address, we):
+    if(self._faults is None):
+      return wishboneStandardStatus.ACK
+
+    return self._faults.status(address, we)
+
+  # Function: _ready
+  # True when the request to address can be terminated this cycle, checked once wait states
+  # are done. Models that must wait on something else, like bus arbitration, hold it with this.
+  def _ready(self, address, we):
+    return True
+
+  # Function: _terminate
+  # Drive the termination signals for status, NONE drives all of them low.
+  def _terminate(self, status):
+    self._set(self.bus.ack, int(status == wishboneStandardStatus.ACK))
+    self._set(self._err, int(status == wishboneStandardStatus.ERR))
+    self._set(self._rty, int(status == wishboneStandardStatus.RTY))
+
+  # Function: _serve
+  # Do the request seen on the bus and terminate it, returns the status it was terminated with.
+  def _serve(self, address, we):
+    status = self._status(address, we)
+
+    if(status == wishboneStandardStatus.ACK):
+      if(we):
+        self._write(address, self.bus.data_i.value, self.bus.sel.value.integer)
+      else:
+        self._set(self.bus.data_o, self._read(address))
+
+    self._terminate(status)
+
+    if(we):
+      self._idle_write.set()
+    else:
+      self._idle_read.set()
+
+    return status
+
+  # Function: _busy
+  # True if _step has anything to do this edge, a cycle on the bus, a termination to drop or reset.
+  def _busy(self):
+    return self.active or self._state != wishboneStandardState.IDLE or self.bus.cyc.value or self._reset.value
+
   # Method: _run
-  # _run thread that deals with read and write request over bus.
+  # _run thread that deals with read and write request over bus, one _step per edge, the
+  # falling edge for asynchronous termination. With a scheduler the slave is stepped by it
+  # instead and this only adds the slave to it.
   async def _run(self):
     self.active = False
 
+    # a burst beat was ACKed before its write data could be seen.
+    self._pending_write = False
+
+    # wait states left before the request is terminated, asynchronous uses None till it is seen.
+    self._wait_left = None if self.asynchronous else 0
+
+    # how the last transfer was terminated.
+    self._last_status = wishboneStandardStatus.NONE
+
+    # cycles the current request has been held in wait states.
+    self._waited = 0
+
+    if(self._scheduler is not None):
+      self._scheduler.add(self)
+      return
+
+    cocotb.start_soon(self._measure_clock())
+
+    edge = FallingEdge if self.asynchronous else RisingEdge
+
     while True:
-      await RisingEdge(self.clock)
+      await edge(self.clock)
+
+      self._step()
+
+      # no cycle on the bus, nothing to do till the master starts one.
+      if(not self._busy()):
+        await RisingEdge(self.bus.cyc)
+
+  # Function: _step
+  # Work done on each edge. Inputs are sampled once per edge, outputs are only written when they change.
+  # IDLE means nothing was terminated last cycle, so a strobe is a new request.
+  # WAIT means the request seen is being held for wait states.
+  # ACTIVE means a termination was driven last cycle, so the signals seen are the beat that was terminated.
+  # If that beat is an incrementing burst beat the master is already driving the next one,
+  # so ACK is held and the next address is served without waiting.
+  def _step(self):
+    if(self.asynchronous):
+      self._step_asynchronous()
+      return
+
+    self._tick()
+
+    if self._reset.value:
+      self._state = wishboneStandardState.IDLE
+      self._pending_write = False
+      self._wait_left = 0
+
+      self._terminate(wishboneStandardStatus.NONE)
+      self._set(self.bus.data_o, 0)
+      return
+
+    if(not (self.bus.cyc.value and self.bus.stb.value)):
+      self.active = False
+      self._pending_write = False
+      self._wait_left = 0
+      self._state = wishboneStandardState.IDLE
+      self._terminate(wishboneStandardStatus.NONE)
+      return
+
+    self.active = True
+
+    address = self.bus.addr.value.integer
+    we = self.bus.we.value
+
+    if(self._state == wishboneStandardState.IDLE):
+      self._waited = 0
+      self._wait_left = self._waits()
+
+      if(self._wait_left or not self._ready(address, we)):
+        self._state = wishboneStandardState.WAIT
+        return
+
+      self._last_status = self._serve(address, we)
+      self._state = wishboneStandardState.ACTIVE
+    elif(self._state == wishboneStandardState.WAIT):
+      self._waited += 1
+
+      if(self._wait_left):
+        self._wait_left -= 1
+
+      if(self._wait_left or not self._ready(address, we)):
+        return
+
+      self._last_status = self._serve(address, we)
+      self._state = wishboneStandardState.ACTIVE
+    elif(self._state == wishboneStandardState.ACTIVE):
+      # the beat on the bus is the one terminated last cycle.
+      if(self._stats is not None):
+        self._stats.record(we, self.bus.sel.value.integer, self._last_status, self._waited + 1)
+
+      if(self._pending_write):
+        self._write(address, self.bus.data_i.value, self.bus.sel.value.integer)
+        self._idle_write.set()
+        self._pending_write = False
+
+      if(self._last_status == wishboneStandardStatus.ACK and int(self._cti.value) == wishboneStandardCti.INCR):
+        address = self._burst_address(address, int(self._bte.value))
+
+        self._waited = 0
+        self._wait_left = self._waits()
+
+        if(self._wait_left or not self._ready(address, we)):
+          self._terminate(wishboneStandardStatus.NONE)
+          self._state = wishboneStandardState.WAIT
+          return
+
+        status = self._status(address, we)
+
+        if(status == wishboneStandardStatus.ACK):
+          if(we):
+            self._pending_write = True
+          else:
+            self._set(self.bus.data_o, self._read(address))
+            self._idle_read.set()
 
-      if not self._reset.value:
-        self.active = True
-        while self.active:
-          if(self._state == wishboneStandardState.IDLE):
-            if(self.bus.cyc.value and self.bus.stb.value):
-              self.bus.err.value = 0
-              self.bus.ack.value = 1
-              if(self.bus.we.value):
-                self._registers[self.bus.addr.value.integer] = self.bus.data_i.value
-                self._idle_write.set()
-              else:
-                self.bus.data_o.value = self._registers[self.bus.addr.value.integer]
-                self._idle_read.set()
-
-              self._state = wishboneStandardState.ACTIVE
-            elif(not self.bus.cyc.value):
-              self.active = False
-          elif(self._state == wishboneStandardState.ACTIVE):
-            if(not self.bus.cyc.value):
-              self.active = False
-
-            if(self.bus.cyc.value and self.bus.stb.value):
-              self.active = True
-              self.bus.ack.value = 0
-              self._state = wishboneStandardState.IDLE
-              if(self.bus.we.value):
-                self._idle_write.set()
-              else:
-                self._idle_read.set()
-
-          await RisingEdge(self.clock)
-      else:
+        self._terminate(status)
 
+        self._last_status = status
+      else:
+        self._terminate(wishboneStandardStatus.NONE)
         self._state = wishboneStandardState.IDLE
+        if(we):
+          self._idle_write.set()
+        else:
+          self._idle_read.set()
+
+  # Function: _step_asynchronous
+  # Work done on each falling edge for asynchronous termination. Inputs are sampled after the
+  # master has driven them on the rising edge, and the termination is driven right away so the
+  # master sees it on the next rising edge. Every beat, burst or not, is served as it is seen.
+  def _step_asynchronous(self):
+    self._tick()
+
+    if self._reset.value:
+      self._wait_left = None
+
+      self._terminate(wishboneStandardStatus.NONE)
+      self._set(self.bus.data_o, 0)
+      return
+
+    if(not (self.bus.cyc.value and self.bus.stb.value)):
+      self.active = False
+      self._wait_left = None
+      self._terminate(wishboneStandardStatus.NONE)
+      return
+
+    self.active = True
+
+    address = self.bus.addr.value.integer
+    we = self.bus.we.value
+
+    if(self._wait_left is None):
+      self._waited = 0
+      self._wait_left = self._waits()
+
+    if(self._wait_left or not self._ready(address, we)):
+      if(self._wait_left):
+        self._wait_left -= 1
+      self._waited += 1
+      self._terminate(wishboneStandardStatus.NONE)
+      return
+
+    status = self._serve(address, we)
+
+    if(self._stats is not None):
+      self._stats.record(we, self.bus.sel.value.integer, status, self._waited + 1)
+
+    self._wait_left = None
+
+# Class: wishboneStandardEchoSlave
+# Respond to master reads and write by returning data, simple echo core.
+class wishboneStandardEchoSlave(wishboneStandardSlave):
+  # Constructor: __init__
+  # Setup defaults and call base class constructor.
+  def __init__(self, entity, name, clock, reset, numreg=256, *args, **kwargs):
+    super().__init__(entity, name, clock, reset, *args, **kwargs)
+
+    self.log.info("Wishbone Classic Echo Slave version %s", __version__)
+    self.log.info("Copyright (c) 2025 Jay Convertino")
+    self.log.info("https://github.com/johnathan-convertino-afrl/cocotbext-wishbone")
+
+    self._registers = {}
+
+    for i in range(numreg):
+      self._registers[i] = 0
+
+  # Function: _read
+  # Return the register at address.
+  def _read(self, address):
+    return self._registers[address]
+
+  # Function: _write
+  # Update the byte lanes of the register at address set in sel.
+  def _write(self, address, data, sel):
+    full = (1 << self.lanes) - 1
+
+    if(sel & full == full):
+      self._registers[address] = data
+      return
+
+    mask = self._lane_mask(sel)
 
-        self.bus.ack.value = 0
-        self.bus.err.value = 0
-        self.bus.data_o.value = 0
+    self._registers[address] = (int(self._registers[address]) & ~mask) | (int(data) & mask)
@@ -0,0 +1,152 @@
+#******************************************************************************
+# file:    generator.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2025/04/18
+#
+# about:   Brief
+# Constrained random traffic generator for the Wishbone Classic master
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+
+import random
+
+from cocotb.triggers import RisingEdge
+
+from .absbus import *
+
+# Class: wishboneStandardGenerator
+# Drive a <wishboneStandardMaster> with seeded constrained random traffic.
+#
+# addresses is a list of (low, high) or (low, high, weight) ranges of word addresses, inclusive,
+# picked by weight then uniform inside, or a function of a random.Random returning an address.
+# None is the whole address space. read is the chance of a read, burst and idle are a number, or
+# a (low, high) range picked from uniformly, of words per burst and idle cycles between bursts.
+# sel is a list of sel patterns writes pick from, None writes all lanes.
+# With idle 0 bursts are queued back to back, up to window outstanding, so a run stopped at
+# coverage closure can go on for up to window bursts that were already queued.
+class wishboneStandardGenerator:
+  # Constructor: __init__
+  # Setup the constraints and seed the random generator.
+  def __init__(self, master, seed=None, addresses=None, read=0.5, burst=1, sel=None, idle=0, window=16):
+    self.master = master
+    self.read = read
+    self.burst = burst
+    self.sel = sel
+    self.idle = idle
+    self.window = window
+
+    self.random = random.Random(seed)
+
+    if(addresses is None):
+      addresses = [(0, 2**master.address_width - 1)]
+
+    self.addresses = addresses
+
+    if(not callable(addresses)):
+      self._weights = [r[2] if len(r) > 2 else 1 for r in addresses]
+
+    # number of bursts issued by run.
+    self.count = 0
+
+  # Function: _range
+  # Pick from a number or a (low, high) range.
+  def _range(self, value):
+    if(isinstance(value, tuple)):
+      return self.random.randint(value[0], value[1])
+
+    return value
+
+  # Function: _address
+  # Pick the start address of a burst of length words, kept inside its range.
+  def _address(self, length):
+    if(callable(self.addresses)):
+      return self.addresses(self.random)
+
+    low, high = self.random.choices(self.addresses, self._weights)[0][:2]
+
+    return self.random.randint(low, max(low, high - length + 1))
+
+  # Function: next
+  # Return the next burst as (we, addresses, data, sel), data is None for reads.
+  def next(self):
+    length = max(1, self._range(self.burst))
+    start = self._address(length)
+    addresses = [start + i for i in range(length)]
+
+    if(self.random.random() < self.read):
+      return (0, addresses, None, None)
+
+    data = [self.random.getrandbits(self.master.data_width) for _ in range(length)]
+    sel = None if self.sel is None else self.random.choice(self.sel)
+
+    return (1, addresses, data, sel)
+
+  # Function: run
+  # Drive bursts till count bursts were issued or coverage is done, whichever is first.
+  # Either can be None, but not both. Returns the number of bursts issued.
+  async def run(self, count=None, coverage=None):
+    if(count is None and coverage is None):
+      raise ValueError("run needs a count or a coverage to stop at.")
+
+    issued = 0
+    handles = []
+
+    while(count is None or issued < count):
+      if(coverage is not None and coverage.done()):
+        break
+
+      we, addresses, data, sel = self.next()
+
+      if(we):
+        handles.append(self.master.issue_write(addresses, data, sel))
+      else:
+        handles.append(self.master.issue_read(addresses))
+
+      issued += 1
+
+      idle = self._range(self.idle)
+
+      if(idle):
+        await self._drain(handles, 0)
+
+        for _ in range(idle):
+          await RisingEdge(self.master.clock)
+      else:
+        await self._drain(handles, self.window - 1)
+
+    await self._drain(handles, 0)
+
+    self.count += issued
+
+    return issued
+
+  # Function: _drain
+  # Wait for the oldest queued bursts till no more than keep are left.
+  async def _drain(self, handles, keep):
+    while(len(handles) > keep):
+      handle = handles.pop(0)
+      await handle
+      self.master.release(handle)
@@ -0,0 +1,249 @@
+#******************************************************************************
+# file:    interconnect.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2025/04/18
+#
+# about:   Brief
+# Shared bus and crossbar model connecting Wishbone Classic masters to slave models
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+
+import bisect
+
+from cocotb.utils import get_sim_time
+
+from ..version import __version__
+from .absbus import *
+from .driver import wishboneStandardSlave
+
+# Class: wishboneStandardInterconnectPort
+# Slave on the bus of one master, its transfers are decoded and arbitrated by the
+# <wishboneStandardInterconnect> that made it. Stalled cycles are wait states.
+class wishboneStandardInterconnectPort(wishboneStandardSlave):
+  # Constructor: __init__
+  # Setup defaults and call base class constructor.
+  def __init__(self, interconnect, entity, name, clock, reset, *args, **kwargs):
+    super().__init__(entity, name, clock, reset, *args, **kwargs)
+
+    self.interconnect = interconnect
+
+    self.name = name
+
+    self._counts = {"reads": 0, "writes": 0, "errors": 0, "stalls": 0, "grants": 0}
+
+  # Function: stats
+  # Return the counts of this port, with the traffic counters when they are on.
+  def stats(self):
+    counts = super().stats() or {}
+
+    counts.update(self._counts)
+
+    return counts
+
+  # Function: reset_stats
+  # Zero the counts of this port and the traffic counters.
+  def reset_stats(self):
+    super().reset_stats()
+
+    for key in self._counts:
+      self._counts[key] = 0
+
+  # Function: _ready
+  # True when this port holds the grant for the slave at address.
+  def _ready(self, address, we):
+    if(self.interconnect._granted(self, address)):
+      return True
+
+    self._counts["stalls"] += 1
+    return False
+
+  # Function: _status
+  # Addresses that are not mapped end with ERR, otherwise ask the slave model.
+  def _status(self, address, we):
+    slave = self.interconnect._decode(address)
+
+    if(slave is None):
+      status = wishboneStandardStatus.ERR
+    elif(hasattr(slave[2], "_status")):
+      status = slave[2]._status(address - slave[0], we)
+    else:
+      status = super()._status(address, we)
+
+    if(status != wishboneStandardStatus.ACK):
+      self._counts["errors"] += 1
+
+    return status
+
+  # Function: _read
+  # Read address from the slave model it decodes to.
+  def _read(self, address):
+    base, size, model = self.interconnect._decode(address)
+
+    self._counts["reads"] += 1
+
+    return model._read(address - base)
+
+  # Function: _write
+  # Write address to the slave model it decodes to.
+  def _write(self, address, data, sel):
+    base, size, model = self.interconnect._decode(address)
+
+    self._counts["writes"] += 1
+
+    model._write(address - base, data, sel)
+
+# Class: wishboneStandardInterconnect
+# Connect masters to slave models by address without any RTL in between.
+# Each master gets a <wishboneStandardInterconnectPort> on its bus, each slave model is
+# anything with the _read and _write hooks, like the slave classes or <wishboneStandardMemory>,
+# mapped at a base word address. As a shared bus one master is granted at a time, as a
+# crossbar each slave is arbitrated on its own. A grant is held till the master drops CYC.
+class wishboneStandardInterconnect:
+  # Constructor: __init__
+  # arbitration picks between masters, see <wishboneStandardArbitration>.
+  def __init__(self, clock, reset, arbitration=wishboneStandardArbitration.PRIORITY, crossbar=False):
+    self.clock = clock
+    self.reset = reset
+    self.arbitration = arbitration
+    self.crossbar = crossbar
+
+    self.ports = []
+
+    # sorted base addresses and matching (base, size, model) for decode.
+    self._bases = []
+    self._slaves = []
+
+    # port holding each slave, or the whole bus under the key None.
+    self._grants = {}
+
+    # index of the port last granted each slave, for round robin.
+    self._last = {}
+
+    # sim time grants were last worked out for.
+    self._time = None
+
+  # Function: add_master
+  # Add a port on the bus entity/name for a master, first added has the highest priority.
+  def add_master(self, entity, name, *args, **kwargs):
+    port = wishboneStandardInterconnectPort(self, entity, name, self.clock, self.reset, *args, **kwargs)
+
+    self.ports.append(port)
+
+    return port
+
+  # Function: add_slave
+  # Map model at word address base for size words.
+  def add_slave(self, model, base, size):
+    index = bisect.bisect(self._bases, base)
+
+    if(index and self._slaves[index-1][0] + self._slaves[index-1][1] > base):
+      raise ValueError(f"Slave at {base} overlaps slave at {self._slaves[index-1][0]}.")
+
+    if(index < len(self._slaves) and base + size > self._slaves[index][0]):
+      raise ValueError(f"Slave at {base} overlaps slave at {self._slaves[index][0]}.")
+
+    self._bases.insert(index, base)
+    self._slaves.insert(index, (base, size, model))
+
+  # Function: stats
+  # Return the counts of every port, keyed by bus name.
+  def stats(self):
+    return {port.name: port.stats() for port in self.ports}
+
+  # Function: _decode
+  # Return the (base, size, model) address falls in, None if it is not mapped.
+  def _decode(self, address):
+    index = bisect.bisect(self._bases, address) - 1
+
+    if(index < 0):
+      return None
+
+    slave = self._slaves[index]
+
+    if(address >= slave[0] + slave[1]):
+      return None
+
+    return slave
+
+  # Function: _target
+  # Key a request to address is arbitrated under.
+  def _target(self, address):
+    if(not self.crossbar):
+      return None
+
+    slave = self._decode(address)
+
+    return None if slave is None else slave[0]
+
+  # Function: _granted
+  # True when port holds the grant address needs, grants are worked out once per cycle.
+  def _granted(self, port, address):
+    time = get_sim_time()
+
+    if(self._time != time):
+      self._time = time
+      self._arbitrate()
+
+    return self._grants.get(self._target(address)) is port
+
+  # Function: _arbitrate
+  # Release grants of masters that ended their cycle, then grant free slaves to a requesting master.
+  # All ports are sampled here so the result does not depend on which port asked first.
+  def _arbitrate(self):
+    requests = {}
+
+    # target each requesting port wants, by port index.
+    wants = {}
+
+    for index, port in enumerate(self.ports):
+      if(not (port.bus.cyc.value and port.bus.stb.value)):
+        continue
+
+      target = self._target(port.bus.addr.value.integer)
+
+      wants[index] = target
+      requests.setdefault(target, []).append(index)
+
+    # a master that ended its cycle, or moved to another slave, gives up its grant.
+    for target, holder in list(self._grants.items()):
+      index = self.ports.index(holder)
+
+      if(not holder.bus.cyc.value or wants.get(index, target) != target):
+        del self._grants[target]
+
+    for target, indexes in requests.items():
+      if(target in self._grants):
+        continue
+
+      if(self.arbitration == wishboneStandardArbitration.ROUND_ROBIN):
+        last = self._last.get(target, -1)
+        index = min(indexes, key=lambda i: (i <= last, i))
+      else:
+        index = indexes[0]
+
+      self._last[target] = index
+      self._grants[target] = self.ports[index]
+      self.ports[index]._counts["grants"] += 1
@@ -0,0 +1,173 @@
+#******************************************************************************
+# file:    memory.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2025/04/09
+#
+# about:   Brief
+# Memory backed slave for Wishbone Classic Standard
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+
+import os
+import mmap
+
+from ..version import __version__
+from .absbus import *
+from .driver import wishboneStandardSlave
+
+# Class: wishboneStandardMemory
+# Flat block of memory with the same _read and _write hooks as a slave model, but no bus.
+# Memory is an anonymous mmap, or a mmap of a sparse file when filename is given,
+# so pages are only allocated when touched and creating any size costs the same.
+# Addresses are word addresses of width bytes, load/dump offsets are in bytes.
+class wishboneStandardMemory:
+  # Constructor: __init__
+  # size is in bytes, width is the number of bytes in a word, granularity is the bits per sel bit.
+  # byteorder is "little" when the lowest byte address is in sel lane 0, "big" when it is in the top lane.
+  def __init__(self, size=2**16, width=4, filename=None, byteorder="little", granularity=8):
+    self._width = width
+
+    self._lane = granularity // 8
+
+    self._lanes = width // self._lane
+
+    self._full = (1 << self._lanes) - 1
+
+    self._byteorder = byteorder
+
+    if(size <= 0 or size % self._width):
+      raise ValueError(f"Memory size must be a multiple of {self._width} bytes.")
+
+    self.size = size
+
+    self._file = None
+
+    if(filename is None):
+      self._mem = mmap.mmap(-1, size)
+    else:
+      self._file = open(filename, "r+b" if os.path.exists(filename) else "w+b")
+      # truncate grows the file without writing it, leaving a sparse file.
+      if(os.fstat(self._file.fileno()).st_size < size):
+        self._file.truncate(size)
+      self._mem = mmap.mmap(self._file.fileno(), size)
+
+  # Function: load
+  # Copy data into memory at byte offset, no bus traffic.
+  def load(self, offset, data):
+    if(offset < 0 or offset + len(data) > self.size):
+      raise ValueError(f"Load of {len(data)} bytes at {offset} is outside of memory.")
+
+    self._mem[offset:offset+len(data)] = data
+
+  # Function: dump
+  # Return a copy of length bytes from byte offset, default is to the end of memory.
+  def dump(self, offset=0, length=None):
+    if(length is None):
+      length = self.size - offset
+
+    if(offset < 0 or offset + length > self.size):
+      raise ValueError(f"Dump of {length} bytes at {offset} is outside of memory.")
+
+    return self._mem[offset:offset+length]
+
+  # Function: close
+  # Release the memory, and flush it to the file if there is one.
+  def close(self):
+    self._mem.close()
+
+    if(self._file is not None):
+      self._file.close()
+      self._file = None
+
+  # Function: _offset
+  # Byte offset of the word at address, raises IndexError if it is outside of memory.
+  def _offset(self, address):
+    offset = address * self._width
+
+    if(offset < 0 or offset >= self.size):
+      raise IndexError(f"Word address {address} is outside of {self.size} bytes of memory.")
+
+    return offset
+
+  # Function: _status
+  # How a transfer to address ends, ERR when it is outside of memory.
+  def _status(self, address, we):
+    if(address < 0 or address * self._width >= self.size):
+      return wishboneStandardStatus.ERR
+
+    return wishboneStandardStatus.ACK
+
+  # Function: _read
+  # Return the word at address.
+  def _read(self, address):
+    offset = self._offset(address)
+
+    return int.from_bytes(self._mem[offset:offset+self._width], self._byteorder)
+
+  # Function: _write
+  # Store the lanes of data set in sel at address.
+  def _write(self, address, data, sel):
+    offset = self._offset(address)
+
+    data = int(data).to_bytes(self._width, self._byteorder)
+
+    if(sel & self._full == self._full):
+      self._mem[offset:offset+self._width] = data
+      return
+
+    for lane in range(self._lanes):
+      if(sel >> lane & 1):
+        # byte offset of the lane in the word.
+        lo = lane * self._lane if self._byteorder == "little" else self._width - (lane + 1) * self._lane
+        self._mem[offset+lo:offset+lo+self._lane] = data[lo:lo+self._lane]
+
+# Class: wishboneStandardMemorySlave
+# Slave backed by a <wishboneStandardMemory> instead of a register per word.
+# Bus addresses are word addresses, load/dump offsets are in bytes.
+class wishboneStandardMemorySlave(wishboneStandardMemory, wishboneStandardSlave):
+  # Constructor: __init__
+  # Setup defaults and call base class constructors. size is in bytes.
+  def __init__(self, entity, name, clock, reset, size=2**16, filename=None, *args, **kwargs):
+    wishboneStandardSlave.__init__(self, entity, name, clock, reset, *args, **kwargs)
+
+    self.log.info("Wishbone Classic Memory Slave version %s", __version__)
+    self.log.info("Copyright (c) 2025 Jay Convertino")
+    self.log.info("https://github.com/johnathan-convertino-afrl/cocotbext-wishbone")
+
+    wishboneStandardMemory.__init__(self, size, self.data_width // 8, filename, self.byteorder, self.granularity)
+
+    if(size // self._width > 2**self.address_width):
+      self.log.warning(f"Memory of {size} bytes is larger than the {self.address_width} bit address bus can reach.")
+
+  # Function: _status
+  # ERR for addresses outside of memory, otherwise the faults of the slave decide.
+  def _status(self, address, we):
+    status = wishboneStandardMemory._status(self, address, we)
+
+    if(status != wishboneStandardStatus.ACK):
+      return status
+
+    return wishboneStandardSlave._status(self, address, we)
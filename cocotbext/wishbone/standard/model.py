@@ -0,0 +1,156 @@
+#******************************************************************************
+# file:    model.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2025/04/18
+#
+# about:   Brief
+# Zero time transaction level master for the Wishbone Classic slave models
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+
+import logging
+
+from ..version import __version__
+from .absbus import *
+from .driver import wishboneStandardMaster
+
+# Class: wishboneStandardModelMaster
+# Master with the same read, write, read_trans and write_trans methods as <wishboneStandardMaster>
+# that calls the _read and _write hooks of a slave model directly, with no bus and no simulation time.
+# model is a slave such as <wishboneStandardEchoSlave>, or anything else with the hooks like
+# <wishboneStandardMemory>. If the model has _status and _waits they are used for ERR/RTY and wait
+# states. When count is True the cycles the pin master would have taken are added to cycle,
+# two for a classic transfer, one for each beat after the first of a burst, plus wait states and backoff.
+class wishboneStandardModelMaster(wishboneStandardMaster):
+  # Constructor: __init__
+  # Setup defaults, no bus is used so the base class constructors are not called.
+  # width is the number of bytes in a word, granularity the bits per sel bit and byteorder
+  # the byte order of the byte methods, as on the bus the model sits on.
+  def __init__(self, model, width=4, pool=None, retries=16, backoff=1, count=True, stats=False, name="model",
+               byteorder="little", granularity=8):
+    self.log = logging.getLogger(f"cocotb.{name}")
+
+    self.log.info("Wishbone Classic Model Master version %s", __version__)
+    self.log.info("Copyright (c) 2025 Jay Convertino")
+    self.log.info("https://github.com/johnathan-convertino-afrl/cocotbext-wishbone")
+
+    self.model = model
+
+    self.policy = wishboneStandardPolicy.ORDER
+
+    self.retries = retries
+    self.backoff = backoff
+    self.timeout = None
+
+    self.count = count
+
+    self.data_width = width * 8
+    self.lanes = width * 8 // granularity
+    self.granularity = granularity
+    self.byteorder = byteorder
+
+    self._width = width
+    self._lane = granularity // 8
+
+    self._full = (1 << self.lanes) - 1
+
+    self._pool = pool
+
+    self._new_trans = wishboneStandardTrans if pool is None else pool.get
+
+    self._cycle = 0
+    self._period = None
+
+    self._stats = wishboneStandardStats(width, self._lane) if stats else None
+
+    # the last transfer asked for another beat of an incrementing burst.
+    self._burst = False
+
+  # Function: cycle
+  # Number of cycles the transfers so far would have taken on the bus.
+  @property
+  def cycle(self):
+    return self._cycle
+
+  # Function: _submit
+  # Do every transaction of the handle now, in order, so it is done when returned.
+  def _submit(self, handle):
+    for trans in handle:
+      self._transfer(trans, handle.we)
+
+    return handle
+
+  # Function: _status
+  # How the model terminates the transfer to address.
+  def _status(self, address, we):
+    if(hasattr(self.model, "_status")):
+      return self.model._status(address, we)
+
+    return wishboneStandardStatus.ACK
+
+  # Function: _transfer
+  # Do one transaction on the model, retrying RTY like the pin master, and tell its owner.
+  def _transfer(self, trans, we):
+    trans.we = we
+
+    if(trans.start is None):
+      trans.start = self._cycle
+
+    if(self.count):
+      self._cycle += 1 if self._burst else 2
+
+      if(hasattr(self.model, "_waits")):
+        self._cycle += self.model._waits()
+
+    status = self._status(trans.address, we)
+
+    while(status == wishboneStandardStatus.RTY and trans.retries < self.retries):
+      trans.retries += 1
+
+      if(self.count):
+        self._cycle += self._backoff(trans.retries) + 2
+
+      status = self._status(trans.address, we)
+
+    if(status == wishboneStandardStatus.ACK):
+      if(we):
+        self.model._write(trans.address, trans.data, self._full if trans.sel is None else trans.sel)
+      else:
+        trans.data = self.model._read(trans.address)
+
+    self._burst = (status == wishboneStandardStatus.ACK and trans.cti == wishboneStandardCti.INCR)
+
+    trans.status = status
+    trans.end = self._cycle
+
+    if(self._stats is not None):
+      self._stats.record(we, trans.sel, status, trans.latency)
+
+    if(status != wishboneStandardStatus.ACK):
+      self.log.warning(f'Transfer to address {trans.address} terminated with {status.name}')
+
+    if(trans.owner is not None):
+      trans.owner.complete(trans)
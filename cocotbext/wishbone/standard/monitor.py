@@ -33,6 +33,7 @@
 
 from ..version import __version__
 from .absbus import *
+from .trace import wishboneStandardTraceWriter
 
 from cocotb.triggers import FallingEdge, RisingEdge, Event
 from cocotb.result import TestFailure
@@ -40,17 +41,65 @@ from cocotb.binary import BinaryValue
 from cocotb.queue import Queue
 
 # Class: wishboneStandardMonitor
-# Check signals to make sure they are applied properly.
+# Check signals to make sure they are applied properly, and rebuild every terminated
+# transfer into a wishboneStandardTrans for scoreboards.
 class wishboneStandardMonitor(wishboneStandardBase):
   # Constructor: __init__
-  # Setup defaults and call base class constructor.
-  def __init__(self, entity, name, clock, resetn, *args, **kwargs):
+  # Setup defaults and call base class constructor. trace is an optional file name every
+  # terminated transfer is written to, see <wishboneStandardTraceWriter>, call close_trace at the end.
+  # coverage is an optional <wishboneStandardCoverage> every terminated transfer is sampled into.
+  def __init__(self, entity, name, clock, resetn, trace=None, coverage=None, *args, **kwargs):
     super().__init__(entity, name, clock, resetn, *args, **kwargs)
 
     self.log.info("Wishbone Classic Monitor version %s", __version__)
     self.log.info("Copyright (c) 2025 Jay Convertino")
     self.log.info("https://github.com/johnathan-convertino-afrl/cocotbext-wishbone")
 
+    self._callbacks = []
+
+    # only made once something iterates the monitor, so nothing piles up when unused.
+    self._queue = None
+
+    self.trace = None
+
+    if(trace is not None):
+      self.trace = wishboneStandardTraceWriter(trace, self.data_width // 8)
+      self.add_callback(self.trace.write)
+
+    self.coverage = coverage
+
+    if(coverage is not None):
+      self.add_callback(coverage.sample)
+
+  # Function: add_callback
+  # Call callback(trans) for every terminated transfer.
+  def add_callback(self, callback):
+    self._callbacks.append(callback)
+
+  # Function: remove_callback
+  # Stop calling callback.
+  def remove_callback(self, callback):
+    self._callbacks.remove(callback)
+
+  # Function: close_trace
+  # Write out and close the trace file, if there is one.
+  def close_trace(self):
+    if(self.trace is not None):
+      self.remove_callback(self.trace.write)
+      self.trace.close()
+      self.trace = None
+
+  # Function: __aiter__
+  # Iterate over terminated transfers with async for, starting from the first one after this call.
+  def __aiter__(self):
+    if(self._queue is None):
+      self._queue = Queue()
+
+    return self
+
+  async def __anext__(self):
+    return await self._queue.get()
+
   # Function: _check_type
   # Check and make sure we are only sending wishboneStandardTrans, this is only here to satisify the need to have it.
   def _check_type(self, trans):
@@ -60,25 +109,115 @@ class wishboneStandardMonitor(wishboneStandardBase):
 
       return True
 
+  # Function: _publish
+  # Hand a terminated transfer to the callbacks and the iterator queue.
+  def _publish(self, trans):
+    for callback in self._callbacks:
+      callback(trans)
+
+    if(self._queue is not None):
+      self._queue.put_nowait(trans)
+
+  # Function: _busy
+  # True if _step has anything to do this edge, something driven on the bus or a transfer waiting.
+  def _busy(self):
+    return self.active or self.bus.cyc.value or self.bus.stb.value or self.bus.ack.value or self._err.value or self._rty.value
+
   # Method: _run
-  # _run thread that deals with checking signals, simple check for now.
+  # _run thread that deals with checking signals, and rebuilding transfers, one _step per
+  # rising edge. With a scheduler the monitor is stepped by it instead and this only adds
+  # the monitor to it.
   async def _run(self):
     self.active = False
 
+    # transfer waiting on termination, with the request signals it started with.
+    self._trans = None
+    self._request = None
+
+    if(self._scheduler is not None):
+      self._scheduler.add(self)
+      return
+
+    await self._measure_clock()
+
     while True:
       await RisingEdge(self.clock)
 
-      # when in reset, check values and idle.
-      if self._reset.value:
-        assert self.bus.stb.value == 0,   "RESET ISSUE: STB is not zero."
-        assert self.bus.cyc.value == 0,   "RESET ISSUE: CYC is not zero."
-        continue
+      self._step()
+
+  # Function: _step
+  # Work done on each rising edge.
+  # Signals are sampled once per rising edge, they are the values for the cycle that just ended.
+  def _step(self):
+    self._tick()
+
+    # when in reset, check values and idle.
+    if self._reset.value:
+      assert self.bus.stb.value == 0,   "RESET ISSUE: STB is not zero."
+      assert self.bus.cyc.value == 0,   "RESET ISSUE: CYC is not zero."
+      self._trans = None
+      return
+
+    stb = self.bus.stb.value
+    cyc = self.bus.cyc.value
+    ack = self.bus.ack.value
+    err = self._err.value
+    rty = self._rty.value
+
+    if stb and not cyc:
+      raise ValueError("CYC ISSUE: CYC is not zero when STB is one.")
+
+    assert (int(ack) + int(err) + int(rty)) <= 1, "TERMINATION ISSUE: more than one of ACK, ERR, RTY at once."
+
+    if not (stb and cyc):
+      assert not ack, "ACK ISSUE: ACK without STB."
+      assert not err, "ERR ISSUE: ERR without STB."
+      assert not rty, "RTY ISSUE: RTY without STB."
+      self._trans = None
+      self.active = False
+      return
+
+    self.active = True
+
+    we = self.bus.we.value
+    sel = self.bus.sel.value
+    address = self.bus.addr.value
+
+    trans = self._trans
+
+    if trans is None:
+      trans = wishboneStandardTrans(address.integer, None, int(self._cti.value), int(self._bte.value), sel.integer)
+      trans.we = int(we)
+      # the strobe was driven on the edge before the one it is seen on.
+      trans.start = self._cycle - 1
+      if we:
+        trans.data = self._integer(self.bus.data_i.value)
+      self._trans = trans
+      self._request = (address, we, sel, self.bus.data_i.value if we else None)
+    else:
+      assert self._request == (address, we, sel, self.bus.data_i.value if we else None), "STABLE ISSUE: request changed while STB is one and waiting on termination."
+
+    if not (ack or err or rty):
+      return
+
+    if not we:
+      trans.data = self._integer(self.bus.data_o.value)
+
+    if ack:
+      trans.status = wishboneStandardStatus.ACK
+    elif err:
+      trans.status = wishboneStandardStatus.ERR
+    else:
+      trans.status = wishboneStandardStatus.RTY
+
+    trans.end = self._cycle
+
+    if(self._stats is not None):
+      self._stats.record(trans.we, trans.sel, trans.status, trans.latency)
 
-      # simple check for now.
-      if self.bus.stb.value:
-        self._idle_read.set()
-        self._idle_write.set()
-        if not self.bus.cyc.value:
-          raise ValueError("CYC ISSUE: CYC is not zero when STB is one.")
+    self._idle_read.set()
+    self._idle_write.set()
 
+    self._publish(trans)
 
+    self._trans = None
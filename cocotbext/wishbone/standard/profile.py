@@ -0,0 +1,136 @@
+#******************************************************************************
+# file:    profile.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2025/04/18
+#
+# about:   Brief
+# Wait state and fault profiles for the Wishbone Classic slave models
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+
+import random
+import itertools
+
+from .absbus import wishboneStandardStatus
+
+# Class: wishboneStandardWaitFixed
+# Wait state profile that always waits the same number of cycles.
+class wishboneStandardWaitFixed:
+  # Constructor: __init__
+  # cycles is the number of wait states before every termination.
+  def __init__(self, cycles=0):
+    if(cycles < 0):
+      raise ValueError("Wait states can not be negative.")
+
+    self.cycles = cycles
+
+  def __iter__(self):
+    return self
+
+  def __next__(self):
+    return self.cycles
+
+# Class: wishboneStandardWaitRandom
+# Wait state profile that picks from low to high, inclusive, with an optional seed for repeatable runs.
+# weights is an optional list with a weight for every value from low to high.
+class wishboneStandardWaitRandom:
+  # Constructor: __init__
+  # Setup the range, weights and random generator.
+  def __init__(self, low=0, high=4, seed=None, weights=None):
+    if(low < 0 or high < low):
+      raise ValueError("Wait state range must be positive and low can not be more than high.")
+
+    if(weights is not None and len(weights) != high - low + 1):
+      raise ValueError("Wait state weights must have one entry for every value from low to high.")
+
+    self.low = low
+    self.high = high
+    self.weights = weights
+
+    self._values = list(range(low, high + 1))
+    self._random = random.Random(seed)
+
+  def __iter__(self):
+    return self
+
+  def __next__(self):
+    if(self.weights is None):
+      return self._random.randint(self.low, self.high)
+
+    return self._random.choices(self._values, self.weights)[0]
+
+# Class: wishboneStandardWaitTrace
+# Wait state profile that plays back a recorded list, or any iterable, of wait states.
+# With repeat the trace starts over at the end, without it every wait after the end is zero.
+class wishboneStandardWaitTrace:
+  # Constructor: __init__
+  # Setup the trace to play back.
+  def __init__(self, trace, repeat=True):
+    self._trace = itertools.cycle(trace) if repeat else iter(trace)
+
+  def __iter__(self):
+    return self
+
+  def __next__(self):
+    return next(self._trace, 0)
+
+# Class: wishboneStandardFaults
+# Fault profile that terminates transfers with ERR or RTY instead of ACK.
+# err_addresses and rty_addresses always fault, err_rate and rty_rate are the chance
+# of a fault at any other address.
+class wishboneStandardFaults:
+  # Constructor: __init__
+  # Setup the fault addresses, rates and random generator.
+  def __init__(self, err_rate=0.0, rty_rate=0.0, err_addresses=(), rty_addresses=(), seed=None):
+    if(err_rate < 0 or rty_rate < 0 or err_rate + rty_rate > 1):
+      raise ValueError("Fault rates must be positive and add up to no more than one.")
+
+    self.err_rate = err_rate
+    self.rty_rate = rty_rate
+    self.err_addresses = set(err_addresses)
+    self.rty_addresses = set(rty_addresses)
+
+    self._random = random.Random(seed)
+
+  # Function: status
+  # Return how the transfer to address should be terminated.
+  def status(self, address, we):
+    if(address in self.err_addresses):
+      return wishboneStandardStatus.ERR
+
+    if(address in self.rty_addresses):
+      return wishboneStandardStatus.RTY
+
+    if(self.err_rate or self.rty_rate):
+      roll = self._random.random()
+
+      if(roll < self.err_rate):
+        return wishboneStandardStatus.ERR
+
+      if(roll < self.err_rate + self.rty_rate):
+        return wishboneStandardStatus.RTY
+
+    return wishboneStandardStatus.ACK
@@ -0,0 +1,166 @@
+#******************************************************************************
+# file:    replay.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2025/04/18
+#
+# about:   Brief
+# Replay of recorded transaction traces through the Wishbone Classic master
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+
+import csv
+import json
+
+from collections import deque
+
+from cocotb.triggers import Timer
+from cocotb.utils import get_sim_time
+
+from .absbus import *
+from .trace import wishboneStandardTraceReader
+
+# Function: _int
+# Return value as an int, strings may be hex with 0x, empty or missing is None.
+def _int(value):
+  if(value is None or value == ""):
+    return None
+
+  if(isinstance(value, str)):
+    return int(value, 0)
+
+  return int(value)
+
+# Function: _we
+# Return 1 for a write and 0 for a read, from 1/0 or w/r/write/read.
+def _we(value):
+  if(isinstance(value, str) and value[:1].lower() in ("w", "r")):
+    return int(value[:1].lower() == "w")
+
+  return int(_int(value))
+
+# Function: _record
+# Return a (time, we, address, data, sel) record from a dict of fields.
+def _record(fields):
+  return (_int(fields.get("time")) or 0, _we(fields["we"]), _int(fields["address"]), _int(fields.get("data")), _int(fields.get("sel")))
+
+# Function: read_csv
+# Yield records from a CSV file with a header row of time, we, address, data and sel.
+# Only we and address are needed, data of a read is the expected data.
+def read_csv(filename):
+  with open(filename, newline="") as f:
+    for fields in csv.DictReader(f):
+      yield _record(fields)
+
+# Function: read_jsonl
+# Yield records from a file of one JSON object per line, with the same fields as read_csv.
+def read_jsonl(filename):
+  with open(filename) as f:
+    for line in f:
+      if(line.strip()):
+        yield _record(json.loads(line))
+
+# Function: read_trace
+# Yield records from a binary trace made by the monitor, only ACKed transfers are kept.
+def read_trace(filename):
+  with wishboneStandardTraceReader(filename) as trace:
+    for time, trans in trace:
+      if(trans.status == wishboneStandardStatus.ACK):
+        yield (time, trans.we, trans.address, trans.data, trans.sel)
+
+# Class: wishboneStandardReplay
+# Feed a recorded stream of reads and writes into a <wishboneStandardMaster>. The source is read
+# as the master needs it, with at most window transfers queued, so traces of any length use the
+# same memory. With timing each transfer is queued no sooner than its recorded time after the
+# first, in units. With check every read that has recorded data is compared when it completes.
+class wishboneStandardReplay:
+  # Constructor: __init__
+  # source is a file name, csv/jsonl by extension and binary trace otherwise, or any
+  # iterable of (time, we, address, data, sel) records.
+  def __init__(self, master, source, timing=False, units="step", check=True, window=64):
+    self.master = master
+    self.timing = timing
+    self.units = units
+    self.check = check
+    self.window = window
+
+    if(isinstance(source, str)):
+      if(source.endswith(".csv")):
+        source = read_csv(source)
+      elif(source.endswith(".jsonl") or source.endswith(".json")):
+        source = read_jsonl(source)
+      else:
+        source = read_trace(source)
+
+    self._source = source
+
+    self.count = 0
+    self.mismatches = 0
+
+  # Function: run
+  # Replay the whole source and wait for the last transfer, returns the number of mismatches.
+  async def run(self):
+    pending = deque()
+
+    start = None
+
+    for time, we, address, data, sel in self._source:
+      if(self.timing):
+        if(start is None):
+          start = (time, get_sim_time(self.units))
+
+        delay = start[1] + (time - start[0]) - get_sim_time(self.units)
+
+        if(delay > 0):
+          await Timer(delay, self.units)
+
+      if(we):
+        handle = self.master.issue_write(address, data, sel)
+      else:
+        handle = self.master.issue_read(address)
+
+      pending.append((handle, data))
+
+      if(len(pending) >= self.window):
+        await self._retire(*pending.popleft())
+
+    while(pending):
+      await self._retire(*pending.popleft())
+
+    return self.mismatches
+
+  # Function: _retire
+  # Wait for handle, compare read data against expected and give the transaction back.
+  async def _retire(self, handle, expected):
+    data = await handle
+
+    self.count += 1
+
+    if(self.check and not handle.we and expected is not None and handle.status() == wishboneStandardStatus.ACK):
+      if(data != expected):
+        self.mismatches += 1
+        self.master.log.error(f'Replay read of address {handle.trans[0].address} returned {data}, expected {expected}')
+
+    self.master.release(handle)
@@ -0,0 +1,129 @@
+#******************************************************************************
+# file:    scheduler.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2025/04/18
+#
+# about:   Brief
+# One clock edge coroutine that steps many Wishbone Classic agents
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+
+import cocotb
+
+from cocotb.triggers import FallingEdge, RisingEdge
+from cocotb.utils import get_sim_time
+
+# Class: wishboneStandardScheduler
+# Steps every agent made with scheduler= from one coroutine per clock edge, in the order the
+# agents were made, instead of each agent waking up on its own. Agents with nothing to do are
+# skipped. Asynchronous slaves are stepped on the falling edge, everything else on the rising edge.
+# Pipeline agents run their own loop and ignore it.
+class wishboneStandardScheduler:
+  # Constructor: __init__
+  # clock is the clock every agent added runs on.
+  def __init__(self, clock):
+    self.clock = clock
+
+    # agents stepped on the rising and on the falling edge.
+    self._rising = []
+    self._falling = []
+
+    self._period = None
+    self._last_edge = None
+
+    cocotb.start_soon(self._run())
+
+  # Function: add
+  # Step agent on every edge it is busy, after the agents already added. It must be on the scheduler clock.
+  def add(self, agent):
+    if(self._period is not None):
+      agent._period = self._period
+      agent._last_edge = self._last_edge
+
+    if(getattr(agent, "asynchronous", False)):
+      if(not self._falling):
+        cocotb.start_soon(self._run_falling())
+      self._falling.append(agent)
+    else:
+      self._rising.append(agent)
+
+  # Function: remove
+  # Stop stepping agent, it is not on the bus anymore.
+  def remove(self, agent):
+    if(agent in self._falling):
+      self._falling.remove(agent)
+    else:
+      self._rising.remove(agent)
+
+  # Function: agents
+  # List of the agents stepped, in order.
+  def agents(self):
+    return self._rising + self._falling
+
+  # Method: _run
+  # Step the busy rising edge agents on every rising edge. Until the clock period is measured
+  # every agent is stepped, so their cycle counts do not miss edges.
+  async def _run(self):
+    while True:
+      await RisingEdge(self.clock)
+
+      if(self._period is None):
+        self._measure()
+
+        for agent in self._rising:
+          agent._step()
+
+        continue
+
+      self._last_edge = get_sim_time()
+
+      for agent in self._rising:
+        if(agent._busy()):
+          agent._step()
+
+  # Method: _run_falling
+  # Step the busy falling edge agents on every falling edge.
+  async def _run_falling(self):
+    while True:
+      await FallingEdge(self.clock)
+
+      for agent in self._falling:
+        if(self._period is None or agent._busy()):
+          agent._step()
+
+  # Function: _measure
+  # Time the first two rising edges, then hand the period to the agents.
+  def _measure(self):
+    now = get_sim_time()
+
+    if(self._last_edge is not None):
+      self._period = now - self._last_edge
+
+      for agent in self.agents():
+        agent._period = self._period
+        agent._last_edge = now
+
+    self._last_edge = now
@@ -0,0 +1,136 @@
+#******************************************************************************
+# file:    scoreboard.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2025/04/18
+#
+# about:   Brief
+# Shadow memory scoreboard for Wishbone Classic traffic
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+
+import re
+
+from .absbus import *
+from .memory import wishboneStandardMemory
+
+# Class: wishboneStandardScoreboard
+# Expected memory image of a slave, kept in a <wishboneStandardMemory> with a second one
+# marking the bytes that were ever written. Only written bytes are checked.
+# Give sample to <wishboneStandardMonitor> add_callback to follow observed traffic, or call
+# expect for issued writes and check for read data. compare checks a whole image at once.
+class wishboneStandardScoreboard(wishboneStandardMemory):
+  # Constructor: __init__
+  # size is in bytes, width is the number of bytes in a word, granularity is the bits per sel bit.
+  def __init__(self, size=2**16, width=4, byteorder="little", granularity=8):
+    super().__init__(size, width, None, byteorder, granularity)
+
+    # all ones in the bytes written, a byte per byte.
+    self._known = wishboneStandardMemory(size, width, None, byteorder, granularity)
+
+    self._ones = (1 << (width * 8)) - 1
+
+    # number of reads checked and (address, expected, data) of each mismatch.
+    self.checked = 0
+    self.errors = []
+
+  # Function: load
+  # Copy data into the expected image at byte offset, its bytes are checked from then on.
+  def load(self, offset, data):
+    super().load(offset, data)
+    self._known.load(offset, b"\xff" * len(data))
+
+  # Function: close
+  # Release the expected image and its mask.
+  def close(self):
+    super().close()
+    self._known.close()
+
+  # Function: expect
+  # Record that word address now holds data in the lanes set in sel, None is every lane.
+  # Those bytes are checked by check and compare from then on.
+  def expect(self, address, data, sel=None):
+    self._write(address, data, self._full if sel is None else sel)
+
+  # Function: _write
+  # Store the lanes of data set in sel at word address, and mark them as known.
+  # Memory model hook, use expect to add expectations.
+  # Unresolved data, None, marks the lanes as not known instead.
+  def _write(self, address, data, sel):
+    if(data is None):
+      self._known._write(address, 0, sel)
+      return
+
+    super()._write(address, data, sel)
+    self._known._write(address, self._ones, sel)
+
+  # Function: check
+  # Compare data read from word address with the known bytes of the expected word.
+  # Returns True if they match, mismatches are added to errors. Unresolved data, None,
+  # is a mismatch when any byte of the word is known.
+  def check(self, address, data):
+    expected = self._read(address)
+    known = self._known._read(address)
+
+    self.checked += 1
+
+    if(data is not None):
+      data = int(data)
+
+    if(known if data is None else (data ^ expected) & known):
+      self.errors.append((address, expected, data))
+      return False
+
+    return True
+
+  # Function: sample
+  # Monitor callback, ACKed writes update the expected image and ACKed reads are checked.
+  def sample(self, trans):
+    if(trans.status != wishboneStandardStatus.ACK):
+      return
+
+    if(trans.we):
+      self.expect(trans.address, trans.data, trans.sel)
+    else:
+      self.check(trans.address, trans.data)
+
+  # Function: compare
+  # Compare the known bytes of the image, from load, expect or sample, from byte offset with actual, a model with dump such as
+  # <wishboneStandardMemorySlave>, or a bytes like image of the memory starting at offset. The images are
+  # compared as integers and the mismatches found with a regex, so no byte is looked at in Python.
+  # Returns a list of (start, end) byte offset ranges that do not match, end not included.
+  def compare(self, actual, offset=0):
+    if(hasattr(actual, "dump")):
+      actual = actual.dump(offset, min(actual.size, self.size) - offset)
+
+    length = min(len(actual), self.size - offset)
+
+    expected = int.from_bytes(self.dump(offset, length), "little")
+    known = int.from_bytes(self._known.dump(offset, length), "little")
+    actual = int.from_bytes(actual[:length], "little")
+
+    diff = ((expected ^ actual) & known).to_bytes(length, "little")
+
+    return [(offset + m.start(), offset + m.end()) for m in re.finditer(rb"[^\x00]+", diff)]
@@ -0,0 +1,227 @@
+#******************************************************************************
+# file:    trace.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2025/04/18
+#
+# about:   Brief
+# Compact binary transaction trace writer and reader for the Wishbone Classic monitor
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+
+import mmap
+import struct
+
+from cocotb.utils import get_sim_time
+
+from .absbus import *
+
+# Variable: _header
+# File header, magic, format version and the number of data bytes in a record.
+_header = struct.Struct("<4sHH")
+
+# Variable: _magic
+# First bytes of every trace file.
+_magic = b"WBTR"
+
+# Variable: _version
+# Version of the record layout.
+_version = 1
+
+# Variable: _unresolved
+# Bit set in the we byte of a record whose data was None, X or Z on the bus.
+_unresolved = 2
+
+# Function: _layout
+# Record layout for width data bytes. Sim time, end cycle, address, sel, latency,
+# we, status, cti, bte, then the data little endian.
+def _layout(width):
+  return struct.Struct(f"<QQQQIBBBB{width}s")
+
+# Class: wishboneStandardTraceWriter
+# Write terminated transfers to filename as fixed size binary records, through a large
+# write buffer so the simulator is not held up by small writes. width is the number of
+# data bytes on the bus. Close it, or use it in a with statement, so the buffer is written out.
+class wishboneStandardTraceWriter:
+  # Constructor: __init__
+  # Create filename and write the header, buffering is the write buffer size in bytes.
+  def __init__(self, filename, width=4, buffering=2**20):
+    self.width = width
+
+    self._record = _layout(width)
+
+    self._file = open(filename, "wb", buffering=buffering)
+
+    self._file.write(_header.pack(_magic, _version, width))
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *args):
+    self.close()
+
+  # Function: write
+  # Add trans, time is the sim time it terminated, None is now. Data of None is
+  # recorded as unresolved and read back as None.
+  def write(self, trans, time=None):
+    if(time is None):
+      time = get_sim_time()
+
+    self._file.write(self._record.pack(
+      time,
+      trans.end or 0,
+      trans.address,
+      trans.sel or 0,
+      trans.latency or 0,
+      int(trans.we or 0) | (_unresolved if trans.data is None else 0),
+      int(trans.status),
+      int(trans.cti),
+      int(trans.bte),
+      (0 if trans.data is None else int(trans.data)).to_bytes(self.width, "little")))
+
+  # Function: flush
+  # Write out the buffer.
+  def flush(self):
+    self._file.flush()
+
+  # Function: close
+  # Write out the buffer and close the file.
+  def close(self):
+    if(not self._file.closed):
+      self._file.close()
+
+# Class: wishboneStandardTraceReader
+# Memory map a trace made by <wishboneStandardTraceWriter> for querying. Records are read
+# when asked for, as (time, trans) with trans a <wishboneStandardTrans>. Records are in time
+# order so a time window is found by binary search, address ranges are checked before a
+# transaction is made for the record.
+class wishboneStandardTraceReader:
+  # Constructor: __init__
+  # Open and map filename.
+  def __init__(self, filename):
+    self._file = open(filename, "rb")
+
+    self._mem = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, width = _header.unpack_from(self._mem, 0)
+
+    if(magic != _magic or version != _version):
+      raise ValueError(f"{filename} is not a version {_version} wishbone trace.")
+
+    self.width = width
+
+    self._record = _layout(width)
+
+    self._count = (len(self._mem) - _header.size) // self._record.size
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *args):
+    self.close()
+
+  def __len__(self):
+    return self._count
+
+  def __getitem__(self, index):
+    if(index < 0):
+      index += self._count
+
+    if(index < 0 or index >= self._count):
+      raise IndexError("trace index out of range")
+
+    return self._unpack(index)
+
+  def __iter__(self):
+    for index in range(self._count):
+      yield self._unpack(index)
+
+  # Function: filter
+  # Yield the (time, trans) records with time in [start, stop) and address in [low, high).
+  # None leaves that end open.
+  def filter(self, low=None, high=None, start=None, stop=None):
+    first = 0 if start is None else self._search(start)
+    last = self._count if stop is None else self._search(stop)
+
+    for index in range(first, last):
+      address = self._address(index)
+
+      if(low is not None and address < low):
+        continue
+
+      if(high is not None and address >= high):
+        continue
+
+      yield self._unpack(index)
+
+  # Function: close
+  # Unmap and close the file.
+  def close(self):
+    self._mem.close()
+    self._file.close()
+
+  # Function: _offset
+  # Byte offset of record index.
+  def _offset(self, index):
+    return _header.size + index * self._record.size
+
+  # Function: _time
+  # Sim time of record index, without unpacking the rest.
+  def _time(self, index):
+    return struct.unpack_from("<Q", self._mem, self._offset(index))[0]
+
+  # Function: _address
+  # Address of record index, without unpacking the rest.
+  def _address(self, index):
+    return struct.unpack_from("<Q", self._mem, self._offset(index) + 16)[0]
+
+  # Function: _search
+  # Index of the first record at or after time.
+  def _search(self, time):
+    low = 0
+    high = self._count
+
+    while(low < high):
+      middle = (low + high) // 2
+
+      if(self._time(middle) < time):
+        low = middle + 1
+      else:
+        high = middle
+
+    return low
+
+  # Function: _unpack
+  # Return record index as (time, trans).
+  def _unpack(self, index):
+    time, end, address, sel, latency, we, status, cti, bte, data = self._record.unpack_from(self._mem, self._offset(index))
+
+    trans = wishboneStandardTrans(address, None if we & _unresolved else int.from_bytes(data, "little"), cti, bte, sel)
+    trans.we = we & ~_unresolved
+    trans.status = wishboneStandardStatus(status)
+    trans.start = end - latency
+    trans.end = end
+
+    return (time, trans)
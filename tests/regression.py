@@ -0,0 +1,311 @@
+#!/usr/bin/env python
+#******************************************************************************
+# file:    regression.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2025/04/18
+#
+# about:   Brief
+# Parallel regression runner with a cached simulator build per source and parameter set
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+
+import argparse
+import concurrent.futures
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import xml.etree.ElementTree as ET
+
+import cocotb
+import cocotb_test.simulator
+
+# Variable: tests_dir
+# Directory of the test suites, one directory with a test.py and test.v each.
+tests_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Variable: build_dir
+# Builds are cached in build_dir/cache/<key>, shards run in build_dir/run/<shard>.
+build_dir = os.path.join(tests_dir, "sim_build")
+
+# Function: discover
+# Import the test module of suite like the simulator would and return the names of its
+# tests and its sweep, the list of parameters of each build, [{}] if it has none.
+def discover(suite):
+    path = os.path.join(tests_dir, suite, "test.py")
+    name = f"regression_{suite}"
+
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+
+    # TestFactory adds the tests it makes to the module it is called from, by its entry in sys.modules.
+    sys.modules[name] = module
+
+    sim_name = cocotb.SIM_NAME
+    cocotb.SIM_NAME = "regression"
+
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        cocotb.SIM_NAME = sim_name
+
+    tests = [key for key, value in vars(module).items() if getattr(value, "im_test", False)]
+
+    return tests, getattr(module, "sweep", [{}])
+
+# Function: build_key
+# Hash of everything that goes into a build, the source contents, parameters, simulator,
+# toplevel and waves. The same key is always the same build.
+def build_key(sources, parameters, toplevel, simulator, waves):
+    key = hashlib.sha256()
+
+    key.update(json.dumps([toplevel, simulator, waves, sorted((str(k), str(v)) for k, v in parameters.items())]).encode())
+
+    for source in sources:
+        key.update(os.path.basename(source).encode())
+        with open(source, "rb") as f:
+            key.update(hashlib.sha256(f.read()).digest())
+
+    return key.hexdigest()[:16]
+
+# Function: build
+# Compile a build once into its cache directory, from copies of the sources kept there so
+# cocotb-test never sees them as newer than the build. A build.json is left when it is done.
+# Returns None on success or the error.
+def build(job):
+    path = job["path"]
+    stamp = os.path.join(path, "build.json")
+
+    if(os.path.exists(stamp)):
+        return None
+
+    shutil.rmtree(path, ignore_errors=True)
+
+    for original, copy in zip(job["originals"], job["sources"]):
+        os.makedirs(os.path.dirname(copy), exist_ok=True)
+        shutil.copy(original, copy)
+
+    log = _redirect(os.path.join(path, "build.log"))
+
+    try:
+        cocotb_test.simulator.run(
+            verilog_sources=job["sources"],
+            toplevel=job["toplevel"],
+            parameters=job["parameters"],
+            sim_build=path,
+            waves=job["waves"],
+            compile_only=True,
+        )
+    except (SystemExit, Exception) as e:
+        return f"build failed, {e}, see {log}"
+
+    with open(stamp, "w") as f:
+        json.dump({k: job[k] for k in ("sources", "toplevel", "parameters", "waves")}, f, indent=2)
+
+    return None
+
+# Function: run
+# Run the tests of a shard against its cached build, in a directory of its own so shards
+# do not share results or waves. Returns None or the error, results are in results.xml.
+def run(shard):
+    path = shard["path"]
+
+    shutil.rmtree(path, ignore_errors=True)
+
+    os.makedirs(path)
+
+    log = _redirect(os.path.join(path, "sim.log"))
+
+    os.environ["COCOTB_RESULTS_FILE"] = os.path.join(path, "results.xml")
+
+    try:
+        cocotb_test.simulator.run(
+            python_search=[os.path.join(tests_dir, shard["suite"])],
+            verilog_sources=shard["sources"],
+            toplevel=shard["toplevel"],
+            module=shard["module"],
+            parameters=shard["parameters"],
+            sim_build=shard["build"],
+            work_dir=path,
+            waves=shard["waves"],
+            testcase=",".join(shard["tests"]) if shard["tests"] else None,
+            extra_env={f'PARAM_{k}': str(v) for k, v in shard["parameters"].items()},
+        )
+    except SystemExit as e:
+        # failed tests are in the results, only a missing results file is an error.
+        if(not os.path.exists(os.environ["COCOTB_RESULTS_FILE"])):
+            return f"{e}, see {log}"
+    except Exception as e:
+        return f"{e}, see {log}"
+
+    return None
+
+# Function: _redirect
+# Send the output of this worker process, and the simulator it starts, to a log file.
+def _redirect(log):
+    f = open(log, "w")
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    os.dup2(f.fileno(), 1)
+    os.dup2(f.fileno(), 2)
+
+    # fds 1 and 2 keep the log open, the worker is long lived so do not leak this one.
+    f.close()
+
+    return log
+
+# Function: plan
+# Return the builds and shards of the suites. Each suite is built once per entry of its sweep,
+# builds with the same key are only made once, and its tests are dealt out to shards shards.
+def plan(suites, shards, simulator, waves):
+    builds = {}
+    runs = []
+
+    for suite in suites:
+        tests, sweep = discover(suite)
+
+        sources = [os.path.join(tests_dir, suite, "test.v")]
+
+        for index, parameters in enumerate(sweep):
+            key = build_key(sources, parameters, "test", simulator, waves)
+            path = os.path.join(build_dir, "cache", key)
+
+            copies = [os.path.join(path, "src", str(i), os.path.basename(s)) for i, s in enumerate(sources)]
+
+            if(key not in builds):
+                builds[key] = {"path": path, "originals": sources, "sources": copies, "toplevel": "test", "parameters": parameters, "waves": waves}
+
+            label = suite if len(sweep) == 1 else f"{suite}[{','.join(f'{k}={v}' for k, v in parameters.items())}]"
+
+            groups = [tests[i::shards] for i in range(min(shards, len(tests)))] or [None]
+
+            for number, group in enumerate(groups):
+                runs.append({
+                    "label": label,
+                    "suite": suite,
+                    "key": key,
+                    "path": os.path.join(build_dir, "run", f"{suite}-{index}-{number}"),
+                    "build": path,
+                    "sources": copies,
+                    "toplevel": "test",
+                    "module": "test",
+                    "parameters": parameters,
+                    "waves": waves,
+                    "tests": group,
+                })
+
+    return builds, runs
+
+# Function: merge
+# Merge the results of every shard into one JUnit file, a test suite per label. Shards that
+# did not leave results are added as an error. Returns the count of tests, failures and errors.
+def merge(runs, errors, filename):
+    root = ET.Element("testsuites")
+    suites = {}
+    counts = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+
+    for shard, error in zip(runs, errors):
+        if(shard["label"] not in suites):
+            suites[shard["label"]] = ET.SubElement(root, "testsuite", name=shard["label"])
+
+        suite = suites[shard["label"]]
+
+        results = os.path.join(shard["path"], "results.xml")
+
+        if(error is not None or not os.path.exists(results)):
+            case = ET.SubElement(suite, "testcase", name=os.path.basename(shard["path"]), classname=shard["label"])
+            ET.SubElement(case, "error", message=str(error))
+            counts["tests"] += 1
+            counts["errors"] += 1
+            continue
+
+        for case in ET.parse(results).iter("testcase"):
+            case.set("classname", shard["label"])
+            suite.append(case)
+
+            counts["tests"] += 1
+
+            if(case.find("failure") is not None):
+                counts["failures"] += 1
+            elif(case.find("error") is not None):
+                counts["errors"] += 1
+            elif(case.find("skipped") is not None):
+                counts["skipped"] += 1
+
+    for suite in suites.values():
+        suite.set("tests", str(len(suite)))
+        suite.set("failures", str(sum(case.find("failure") is not None for case in suite)))
+        suite.set("errors", str(sum(case.find("error") is not None for case in suite)))
+
+    ET.ElementTree(root).write(filename, encoding="utf-8", xml_declaration=True)
+
+    return counts
+
+# Function: main
+# Build what is not cached yet, run the shards on a process pool, merge the results.
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the cocotb test suites in parallel with cached simulator builds.")
+    parser.add_argument("suites", nargs="*", help="test suite directories to run, default is all of them")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--shards", type=int, default=None, help="shards per build, default is jobs")
+    parser.add_argument("--waves", action="store_true", help="dump waves in each shard directory")
+    parser.add_argument("--clean", action="store_true", help="remove the build cache first")
+    parser.add_argument("--results", default=os.path.join(build_dir, "results.xml"), help="merged JUnit results file")
+    args = parser.parse_args(argv)
+
+    suites = args.suites or sorted(d for d in os.listdir(tests_dir) if os.path.exists(os.path.join(tests_dir, d, "test.py")) and os.path.exists(os.path.join(tests_dir, d, "test.v")))
+
+    if(args.clean):
+        shutil.rmtree(os.path.join(build_dir, "cache"), ignore_errors=True)
+
+    simulator = os.environ.get("SIM", "icarus")
+
+    builds, runs = plan(suites, args.shards or args.jobs, simulator, args.waves)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        keys = list(builds)
+        failed = dict(zip(keys, pool.map(build, [builds[k] for k in keys])))
+
+        for key, error in failed.items():
+            print(f"build {key} {builds[key]['parameters']}: {'cached or built' if error is None else error}")
+
+        todo = [shard for shard in runs if failed[shard["key"]] is None]
+        errors = dict(zip((id(s) for s in todo), pool.map(run, todo)))
+
+    errors = [errors.get(id(shard), failed[shard["key"]]) for shard in runs]
+
+    counts = merge(runs, errors, args.results)
+
+    print(f"{counts['tests']} tests, {counts['failures']} failed, {counts['errors']} errors, {counts['skipped']} skipped, results in {args.results}")
+
+    return int(bool(counts["failures"] or counts["errors"]))
+
+if __name__ == "__main__":
+    sys.exit(main())
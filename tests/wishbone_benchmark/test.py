@@ -0,0 +1,254 @@
+#!/usr/bin/env python
+#******************************************************************************
+# file:    test.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2025/04/18
+#
+# about:   Brief
+# Cocotb benchmarks of wishbone classic driver throughput
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+# """
+#
+# Copyright (c) 2020 Alex Forencich
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# """
+
+import json
+import logging
+import os
+import random
+import time
+
+import pytest
+
+import cocotb_test.simulator
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import Timer, RisingEdge
+from cocotb.utils import get_sim_time
+from cocotb.regression import TestFactory
+
+
+try:
+    from cocotbext.wishbone.standard import wishboneStandardMaster, wishboneStandardMemorySlave
+except ImportError as e:
+    import sys
+    sys.path.append("../../")
+    from cocotbext.wishbone.standard import wishboneStandardMaster, wishboneStandardMemorySlave
+
+# Variable: count
+# Number of words moved by each benchmark, BENCHMARK_COUNT in the environment overrides it.
+count = int(os.environ.get("BENCHMARK_COUNT", 1024))
+
+# Variable: results
+# JSON lines file every result is added to, kept with the build output in sim_build.
+# BENCHMARK_RESULTS in the environment overrides it.
+results = os.environ.get("BENCHMARK_RESULTS", os.path.join(os.path.dirname(os.path.abspath(__file__)), "sim_build", "results.jsonl"))
+
+# Class: TB
+# Create the device under test which is the master and a memory slave with wait states,
+# terminating asynchronously or with a registered ACK.
+class TB:
+    def __init__(self, dut, wait=0, asynchronous=False):
+        self.dut = dut
+
+        self.log = logging.getLogger("cocotb.tb")
+        self.log.setLevel(logging.INFO)
+
+        cocotb.start_soon(Clock(dut.clk, 2, units="ns").start())
+
+        self.words = min(2**len(dut.s_wb_addr), 2**16)
+
+        self.master = wishboneStandardMaster(dut, "s_wb", dut.clk, dut.rst)
+
+        self.width = self.master.data_width // 8
+
+        self.slave = wishboneStandardMemorySlave(dut, "s_wb", dut.clk, dut.rst, size=self.words * self.width, wait=wait, asynchronous=asynchronous)
+
+    async def reset(self):
+        self.dut.rst.setimmediatevalue(1)
+        await Timer(5, units="ns")
+        self.dut.rst.value = 0
+        await RisingEdge(self.dut.clk)
+
+# Function: sequential_pattern
+# Word addresses counting up from zero.
+def sequential_pattern(words):
+    return [a % words for a in range(count)]
+
+# Function: random_pattern
+# Word addresses picked at random, the same every run.
+def random_pattern(words):
+    rng = random.Random(1)
+
+    return [rng.randrange(words) for _ in range(count)]
+
+# Function: single_api
+# One read or write call per word.
+async def single_api(tb, addresses, data):
+    for address, value in zip(addresses, data):
+        await tb.master.write(address, value)
+
+    for address in addresses:
+        await tb.master.read(address)
+
+# Function: list_api
+# One read and one write call with the whole list, contiguous runs go out as bursts.
+async def list_api(tb, addresses, data):
+    await tb.master.write(addresses, data)
+
+    await tb.master.read(addresses)
+
+# Function: bulk_api
+# Byte reads and writes of each run of contiguous words.
+async def bulk_api(tb, addresses, data):
+    runs = []
+
+    for address in addresses:
+        if(runs and runs[-1][0] + runs[-1][1] == address):
+            runs[-1][1] += 1
+        else:
+            runs.append([address, 1])
+
+    payload = bytes(range(256)) * (tb.width * len(addresses) // 256 + 1)
+
+    for address, length in runs:
+        await tb.master.write_bytes(address * tb.width, payload[:length * tb.width])
+
+    for address, length in runs:
+        await tb.master.read_bytes(address * tb.width, length * tb.width)
+
+# Function: run_benchmark
+# Time a pattern of reads and writes through one of the master APIs and add the result to results.
+async def run_benchmark(dut, pattern=None, api=None, wait=0, asynchronous=False):
+
+    tb = TB(dut, wait, asynchronous)
+
+    await tb.reset()
+
+    addresses = pattern(tb.words)
+
+    data = [a & ((1 << (tb.width * 8)) - 1) for a in addresses]
+
+    sim_start = get_sim_time("ns")
+    wall_start = time.perf_counter()
+
+    await api(tb, addresses, data)
+
+    wall = time.perf_counter() - wall_start
+    cycles = (get_sim_time("ns") - sim_start) / 2
+
+    transactions = 2 * len(addresses)
+
+    result = {
+        "pattern": pattern.__name__,
+        "api": api.__name__,
+        "wait": wait,
+        "asynchronous": asynchronous,
+        "bus_width": tb.width,
+        "address_width": tb.master.address_width,
+        "simulator": cocotb.SIM_NAME,
+        "transactions": transactions,
+        "cycles": cycles,
+        "wall_seconds": wall,
+        "transactions_per_second": transactions / wall,
+        "transactions_per_cycle": transactions / cycles,
+    }
+
+    tb.log.info(json.dumps(result))
+
+    os.makedirs(os.path.dirname(os.path.abspath(results)), exist_ok=True)
+
+    with open(results, "a") as f:
+        f.write(json.dumps(result) + "\n")
+
+
+# If its a sim... create the test factory with these options.
+if cocotb.SIM_NAME:
+
+    factory = TestFactory(run_benchmark)
+    factory.add_option("pattern", [sequential_pattern, random_pattern])
+    factory.add_option("api", [single_api, list_api, bulk_api])
+    factory.add_option("wait", [0, 2])
+    factory.add_option("asynchronous", [False, True])
+    factory.generate_tests()
+
+
+# cocotb-test
+tests_dir = os.path.dirname(__file__)
+
+# Variable: sweep
+# Parameters of each build, one per bus width, used by test and by tests/regression.py.
+sweep = [{"ADDRESS_WIDTH": 16, "BUS_WIDTH": bus_width} for bus_width in (1, 4, 8, 32, 64)]
+
+# Function: test
+# Main cocotb function that specifies how to put the test together, once per bus width.
+@pytest.mark.parametrize("sweep_parameters", sweep, ids=lambda p: str(p["BUS_WIDTH"]))
+def test(request, sweep_parameters):
+    dut = "test"
+    module = os.path.splitext(os.path.basename(__file__))[0]
+    toplevel = dut
+
+    verilog_sources = [
+        os.path.join(tests_dir, f"{dut}.v"),
+    ]
+
+    parameters = dict(sweep_parameters)
+
+    extra_env = {f'PARAM_{k}': str(v) for k, v in parameters.items()}
+
+    sim_build = os.path.join(tests_dir, "sim_build",
+        request.node.name.replace('[', '-').replace(']', ''))
+
+    cocotb_test.simulator.run(
+        python_search=[tests_dir],
+        verilog_sources=verilog_sources,
+        toplevel=toplevel,
+        module=module,
+        parameters=parameters,
+        sim_build=sim_build,
+        extra_env=extra_env,
+    )
@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+#******************************************************************************
+# file:    test.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2025/04/18
+#
+# about:   Brief
+# Cocotb test bench for the wishbone classic interconnect model
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+# """
+#
+# Copyright (c) 2020 Alex Forencich
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# """
+
+import itertools
+import logging
+import os
+import random
+
+import cocotb_test.simulator
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import Timer, RisingEdge, NextTimeStep
+from cocotb.regression import TestFactory
+
+
+try:
+    from cocotbext.wishbone.standard import wishboneStandardMaster, wishboneStandardMemory, wishboneStandardStatus
+    from cocotbext.wishbone.standard import wishboneStandardInterconnect, wishboneStandardArbitration
+except ImportError as e:
+    import sys
+    sys.path.append("../../")
+    from cocotbext.wishbone.standard import wishboneStandardMaster, wishboneStandardMemory, wishboneStandardStatus
+    from cocotbext.wishbone.standard import wishboneStandardInterconnect, wishboneStandardArbitration
+
+# Class: TB
+# Create the device under test which is two masters and two memories behind the interconnect.
+class TB:
+    def __init__(self, dut, arbitration=wishboneStandardArbitration.PRIORITY, crossbar=False):
+        self.dut = dut
+
+        self.log = logging.getLogger("cocotb.tb")
+        self.log.setLevel(logging.DEBUG)
+
+        cocotb.start_soon(Clock(dut.clk, 2, units="ns").start())
+
+        width = len(dut.m0_wb_data_o) // 8
+
+        self.interconnect = wishboneStandardInterconnect(dut.clk, dut.rst, arbitration, crossbar)
+
+        self.masters = []
+
+        for name in ["m0_wb", "m1_wb"]:
+            self.interconnect.add_master(dut, name)
+            self.masters.append(wishboneStandardMaster(dut, name, dut.clk, dut.rst))
+
+        self.memories = [wishboneStandardMemory(2**12, width), wishboneStandardMemory(2**12, width)]
+
+        self.interconnect.add_slave(self.memories[0], 0x0000, 2**12 // width)
+        self.interconnect.add_slave(self.memories[1], 0x1000, 2**12 // width)
+
+    async def reset(self):
+        self.dut.rst.setimmediatevalue(1)
+        await Timer(5, units="ns")
+        self.dut.rst.value = 0
+
+# Function: run_test
+# Tests both masters at once, each to its own memory, with every arbitration and topology.
+async def run_test(dut, payload_data=None, arbitration=None, crossbar=False):
+
+    tb = TB(dut, arbitration, crossbar)
+
+    await tb.reset()
+
+    test_data = payload_data()
+
+    async def agent(master, base):
+        await master.write([base + a for a in test_data], test_data)
+
+        rx_data = await master.read([base + a for a in test_data])
+
+        assert test_data == rx_data, "RECEIVED DATA DOES NOT MATCH"
+
+        for test_value in test_data[:16]:
+
+            await master.write(base + test_value, test_value + 1)
+
+            rx_data = await master.read(base + test_value)
+
+            assert test_value + 1 == rx_data, "RECEIVED DATA DOES NOT MATCH"
+
+    agents = [cocotb.start_soon(agent(tb.masters[0], 0x0000)), cocotb.start_soon(agent(tb.masters[1], 0x1000))]
+
+    for a in agents:
+        await a
+
+    width = len(dut.m0_wb_data_o) // 8
+
+    assert tb.memories[1].dump(0, len(test_data) * width) == b''.join((d + 1 if d < 16 else d).to_bytes(width, "little") for d in test_data), "MEMORY DOES NOT MATCH WRITTEN DATA"
+
+    handle = tb.masters[0].issue_read(0x2000)
+
+    await handle
+
+    assert handle.status() == wishboneStandardStatus.ERR, "UNMAPPED ADDRESS NOT ERR"
+
+    stats = tb.interconnect.stats()
+
+    assert stats["m1_wb"]["writes"] == len(test_data) + 16, "WRITE COUNT DOES NOT MATCH"
+
+    if(crossbar):
+        assert stats["m0_wb"]["stalls"] == 0 and stats["m1_wb"]["stalls"] == 0, "CROSSBAR STALLED A MASTER"
+    else:
+        assert stats["m0_wb"]["stalls"] + stats["m1_wb"]["stalls"] > 0, "SHARED BUS NEVER ARBITRATED"
+
+
+# Function: incrementing_payload
+# Generate a list of ints that increment from 0 to 2^8
+def incrementing_payload():
+    return list(range(2**8))
+
+
+# If its a sim... create the test factory with these options.
+if cocotb.SIM_NAME:
+
+    factory = TestFactory(run_test)
+    factory.add_option("payload_data", [incrementing_payload])
+    factory.add_option("arbitration", [wishboneStandardArbitration.PRIORITY, wishboneStandardArbitration.ROUND_ROBIN])
+    factory.add_option("crossbar", [False, True])
+    factory.generate_tests()
+
+
+# cocotb-test
+tests_dir = os.path.dirname(__file__)
+
+# Function: test
+# Main cocotb function that specifies how to put the test together.
+def test(request):
+    dut = "test"
+    module = os.path.splitext(os.path.basename(__file__))[0]
+    toplevel = dut
+
+    verilog_sources = [
+        os.path.join(tests_dir, f"{dut}.v"),
+    ]
+
+    parameters = {}
+
+    extra_env = {f'PARAM_{k}': str(v) for k, v in parameters.items()}
+
+    sim_build = os.path.join(tests_dir, "sim_build",
+        request.node.name.replace('[', '-').replace(']', ''))
+
+    cocotb_test.simulator.run(
+        python_search=[tests_dir],
+        verilog_sources=verilog_sources,
+        toplevel=toplevel,
+        module=module,
+        parameters=parameters,
+        sim_build=sim_build,
+        extra_env=extra_env,
+    )
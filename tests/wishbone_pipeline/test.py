@@ -0,0 +1,318 @@
+#!/usr/bin/env python
+#******************************************************************************
+# file:    test.py
+#
+# author:  JAY CONVERTINO
+#
+# date:    2025/03/17
+#
+# about:   Brief
+# Cocotb test bench for wishbone pipelined
+#
+# license: License MIT
+# Copyright 2025 Jay Convertino
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+#******************************************************************************
+# """
+#
+# Copyright (c) 2020 Alex Forencich
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# """
+
+import itertools
+import logging
+import os
+import random
+
+import cocotb_test.simulator
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import Timer, RisingEdge, NextTimeStep
+from cocotb.regression import TestFactory
+from cocotb.utils import get_sim_time
+
+
+try:
+    from cocotbext.wishbone.pipeline import wishbonePipelineMaster, wishbonePipelineEchoSlave
+    from cocotbext.wishbone.standard import wishboneStandardFaults, wishboneStandardStatus
+except ImportError as e:
+    import sys
+    sys.path.append("../../")
+    from cocotbext.wishbone.pipeline import wishbonePipelineMaster, wishbonePipelineEchoSlave
+    from cocotbext.wishbone.standard import wishboneStandardFaults, wishboneStandardStatus
+
+# Class: TB
+# Create the device under test which is the master/slave.
+class TB:
+    def __init__(self, dut, **kwargs):
+        self.dut = dut
+
+        self.log = logging.getLogger("cocotb.tb")
+        self.log.setLevel(logging.DEBUG)
+
+        cocotb.start_soon(Clock(dut.clk, 2, units="ns").start())
+
+        self.master  = wishbonePipelineMaster(dut, "s_wb", dut.clk, dut.rst)
+        self.slave = wishbonePipelineEchoSlave(dut, "s_wb", dut.clk, dut.rst, **kwargs)
+
+    async def reset(self):
+        self.dut.rst.setimmediatevalue(1)
+        await Timer(5, units="ns")
+        self.dut.rst.value = 0
+
+# Function: run_test
+# Tests the source/sink for valid transmission of data.
+async def run_test(dut, payload_data=None):
+
+    tb = TB(dut)
+
+    await tb.reset()
+
+    # dut.s_wb_ack.value = 1
+
+    for test_data in payload_data():
+
+        tb.log.info(f'TEST VALUE : {test_data, test_data}')
+
+        await tb.master.write(test_data, test_data)
+
+        rx_data = await tb.master.read(test_data)
+
+        assert test_data == rx_data, "RECEIVED DATA DOES NOT MATCH"
+
+# Function: run_test_list
+# Tests back to back pipelined requests by sending the whole payload at once.
+async def run_test_list(dut, payload_data=None):
+
+    tb = TB(dut)
+
+    await tb.reset()
+
+    test_data = payload_data()
+
+    await tb.master.write(test_data, test_data)
+
+    rx_data = await tb.master.read(test_data)
+
+    assert test_data == rx_data, "RECEIVED DATA DOES NOT MATCH"
+
+# Function: count_outstanding
+# Track the most requests accepted by the slave and not yet terminated, sampled every clock edge.
+async def count_outstanding(dut, peak):
+    outstanding = 0
+
+    while True:
+        await RisingEdge(dut.clk)
+
+        if dut.s_wb_cyc.value and dut.s_wb_stb.value and not dut.s_wb_stall.value:
+            outstanding += 1
+
+        if dut.s_wb_ack.value or dut.s_wb_err.value:
+            outstanding -= 1
+
+        peak[0] = max(peak[0], outstanding)
+
+# Function: run_test_latency
+# Tests that back to back requests are pipelined, N transfers take about N plus the slave
+# latency cycles, not a round trip each, and more than one request is waiting on ACK at once.
+async def run_test_latency(dut, payload_data=None, latency=1):
+
+    tb = TB(dut, latency=latency)
+
+    await tb.reset()
+
+    peak = [0]
+
+    cocotb.start_soon(count_outstanding(dut, peak))
+
+    test_data = payload_data()
+
+    start = get_sim_time("ns")
+
+    await tb.master.write(test_data, test_data)
+
+    cycles = (get_sim_time("ns") - start) / 2
+
+    assert cycles <= len(test_data) + latency + 4, f"WRITES NOT PIPELINED, {cycles} CYCLES FOR {len(test_data)}"
+
+    rx_data = await tb.master.read(test_data)
+
+    assert test_data == rx_data, "RECEIVED DATA DOES NOT MATCH"
+
+    if latency > 1:
+        assert peak[0] > 1, "NO MORE THAN ONE REQUEST OUTSTANDING"
+
+    assert peak[0] <= tb.master.outstanding, "OUTSTANDING WINDOW EXCEEDED"
+
+# Function: run_test_reset
+# Tests that requests cut off by a reset end with ERR instead of never completing.
+async def run_test_reset(dut, payload_data=None):
+
+    tb = TB(dut, latency=4)
+
+    await tb.reset()
+
+    test_data = payload_data()
+
+    handle = tb.master.issue_read(test_data[:8])
+
+    for _ in range(4):
+        await RisingEdge(dut.clk)
+
+    await tb.reset()
+
+    await handle
+
+    assert wishboneStandardStatus.ERR in handle.status(), "REQUESTS CUT OFF BY RESET NOT ENDED WITH ERR"
+
+# Function: run_test_wait
+# Tests that wait states hold STALL and every request still gets its own data back.
+async def run_test_wait(dut, payload_data=None, wait=0):
+
+    tb = TB(dut, wait=wait, stats=True)
+
+    await tb.reset()
+
+    test_data = payload_data()
+
+    await tb.master.write(test_data, test_data)
+
+    rx_data = await tb.master.read(test_data)
+
+    assert test_data == rx_data, "RECEIVED DATA DOES NOT MATCH"
+
+    stats = tb.slave.stats()
+
+    assert stats["writes"] + stats["reads"] == 2 * len(test_data), "SLAVE COUNTERS DO NOT MATCH"
+
+    assert stats["wait"] == 2 * len(test_data) * wait, "WAIT STATES NOT COUNTED"
+
+# Function: run_test_faults
+# Tests that requests picked by faults are retired with ERR and the rest still complete.
+async def run_test_faults(dut, payload_data=None):
+
+    tb = TB(dut, faults=wishboneStandardFaults(err_addresses=[7]))
+
+    await tb.reset()
+
+    test_data = payload_data()
+
+    handle = tb.master.issue_read(test_data)
+
+    await handle
+
+    status = handle.status()
+
+    assert status[7] == wishboneStandardStatus.ERR, "ERR NOT REPORTED"
+
+    assert status.count(wishboneStandardStatus.ACK) == len(test_data) - 1, "ACK NOT REPORTED"
+
+
+# Function: incrementing_payload
+# Generate a list of ints that increment from 0 to 2^8
+def incrementing_payload():
+    return list(range(2**8))
+
+# # Function: random_payload
+# # Generate a list of random ints 2^16 in the range of 0 to 2^16
+# def random_payload():
+#     return random.sample(range(2**16), 2**16)
+
+
+# If its a sim... create the test factory with these options.
+if cocotb.SIM_NAME:
+
+    factory = TestFactory(run_test)
+    factory.add_option("payload_data", [incrementing_payload])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_list)
+    factory.add_option("payload_data", [incrementing_payload])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_latency)
+    factory.add_option("payload_data", [incrementing_payload])
+    factory.add_option("latency", [1, 3])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_reset)
+    factory.add_option("payload_data", [incrementing_payload])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_wait)
+    factory.add_option("payload_data", [incrementing_payload])
+    factory.add_option("wait", [1, 3])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_faults)
+    factory.add_option("payload_data", [incrementing_payload])
+    factory.generate_tests()
+
+
+# cocotb-test
+tests_dir = os.path.dirname(__file__)
+
+# Function: test
+# Main cocotb function that specifies how to put the test together.
+def test(request):
+    dut = "test"
+    module = os.path.splitext(os.path.basename(__file__))[0]
+    toplevel = dut
+
+    verilog_sources = [
+        os.path.join(tests_dir, f"{dut}.v"),
+    ]
+
+    parameters = {}
+
+    extra_env = {f'PARAM_{k}': str(v) for k, v in parameters.items()}
+
+    sim_build = os.path.join(tests_dir, "sim_build",
+        request.node.name.replace('[', '-').replace(']', ''))
+
+    cocotb_test.simulator.run(
+        python_search=[tests_dir],
+        verilog_sources=verilog_sources,
+        toplevel=toplevel,
+        module=module,
+        parameters=parameters,
+        sim_build=sim_build,
+        extra_env=extra_env,
+    )
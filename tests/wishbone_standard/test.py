@@ -59,26 +59,40 @@ import itertools
 import logging
 import os
 import random
+import tempfile
 
 import cocotb_test.simulator
 
 import cocotb
 from cocotb.clock import Clock
 from cocotb.triggers import Timer, RisingEdge, NextTimeStep
+from cocotb.utils import get_sim_time
 from cocotb.regression import TestFactory
 
 
 try:
-    from cocotbext.wishbone.standard import wishboneStandardMaster, wishboneStandardEchoSlave, wishboneStandardMonitor
+    from cocotbext.wishbone.standard import wishboneStandardMaster, wishboneStandardEchoSlave, wishboneStandardMemorySlave, wishboneStandardMonitor, wishboneStandardTransPool, wishboneStandardTrans
+    from cocotbext.wishbone.standard import wishboneStandardWaitRandom, wishboneStandardWaitTrace, wishboneStandardWaitFixed
+    from cocotbext.wishbone.standard import wishboneStandardFaults, wishboneStandardStatus, wishboneStandardModelMaster
+    from cocotbext.wishbone.standard import wishboneStandardTraceReader, wishboneStandardTraceWriter, wishboneStandardReplay
+    from cocotbext.wishbone.standard import wishboneStandardCallbackSlave, wishboneStandardAccess, wishboneStandardMemory
+    from cocotbext.wishbone.standard import wishboneStandardGenerator, wishboneStandardCoverage, wishboneStandardScheduler
+    from cocotbext.wishbone.standard import wishboneStandardScoreboard
 except ImportError as e:
     import sys
     sys.path.append("../../")
-    from cocotbext.wishbone.standard import wishboneStandardMaster, wishboneStandardEchoSlave, wishboneStandardMonitor
+    from cocotbext.wishbone.standard import wishboneStandardMaster, wishboneStandardEchoSlave, wishboneStandardMemorySlave, wishboneStandardMonitor, wishboneStandardTransPool, wishboneStandardTrans
+    from cocotbext.wishbone.standard import wishboneStandardWaitRandom, wishboneStandardWaitTrace, wishboneStandardWaitFixed
+    from cocotbext.wishbone.standard import wishboneStandardFaults, wishboneStandardStatus, wishboneStandardModelMaster
+    from cocotbext.wishbone.standard import wishboneStandardTraceReader, wishboneStandardTraceWriter, wishboneStandardReplay
+    from cocotbext.wishbone.standard import wishboneStandardCallbackSlave, wishboneStandardAccess, wishboneStandardMemory
+    from cocotbext.wishbone.standard import wishboneStandardGenerator, wishboneStandardCoverage, wishboneStandardScheduler
+    from cocotbext.wishbone.standard import wishboneStandardScoreboard
 
 # Class: TB
 # Create the device under test which is the master/slave.
 class TB:
-    def __init__(self, dut):
+    def __init__(self, dut, slave=wishboneStandardEchoSlave, pool=None, byteorder="little", **kwargs):
         self.dut = dut
 
         self.log = logging.getLogger("cocotb.tb")
@@ -86,8 +100,8 @@ class TB:
 
         cocotb.start_soon(Clock(dut.clk, 2, units="ns").start())
 
-        self.master  = wishboneStandardMaster(dut, "s_wb", dut.clk, dut.rst)
-        self.slave = wishboneStandardEchoSlave(dut, "s_wb", dut.clk, dut.rst)
+        self.master  = wishboneStandardMaster(dut, "s_wb", dut.clk, dut.rst, pool, byteorder=byteorder)
+        self.slave = slave(dut, "s_wb", dut.clk, dut.rst, byteorder=byteorder, **kwargs)
         self.monitor = wishboneStandardMonitor(dut, "s_wb", dut.clk, dut.rst)
 
     async def reset(self):
@@ -115,12 +129,700 @@ async def run_test(dut, payload_data=None):
 
         assert test_data == rx_data, "RECEIVED DATA DOES NOT MATCH"
 
+# Function: run_test_burst
+# Tests registered feedback bursts by sending the whole payload as one list.
+async def run_test_burst(dut, payload_data=None):
+
+    tb = TB(dut)
+
+    await tb.reset()
+
+    test_data = payload_data()
+
+    await tb.master.write(test_data, test_data)
+
+    rx_data = await tb.master.read(test_data)
+
+    assert test_data == rx_data, "RECEIVED DATA DOES NOT MATCH"
+
+
+# Function: run_test_memory
+# Tests the memory slave, data loaded without the bus is read over it and written data is dumped back.
+async def run_test_memory(dut, payload_data=None):
+
+    tb = TB(dut, wishboneStandardMemorySlave, size=2**16)
+
+    await tb.reset()
+
+    test_data = payload_data()
+
+    width = len(dut.s_wb_data_o) // 8
+
+    image = b''.join(d.to_bytes(width, "little") for d in test_data)
+
+    tb.slave.load(0, image)
+
+    rx_data = await tb.master.read(test_data)
+
+    assert test_data == rx_data, "RECEIVED DATA DOES NOT MATCH LOADED DATA"
+
+    offset = tb.slave.size // width - len(test_data)
+
+    await tb.master.write([offset + a for a in test_data], test_data)
+
+    assert tb.slave.dump(offset * width, len(image)) == image, "DUMPED DATA DOES NOT MATCH WRITTEN DATA"
+
+    handle = tb.master.issue_read(tb.slave.size // width)
+
+    await handle
+
+    assert handle.status() == wishboneStandardStatus.ERR, "READ PAST THE END OF MEMORY NOT REPORTED"
+
+# Function: run_test_bytes
+# Tests unaligned byte writes, only the selected byte lanes may change in the slave.
+async def run_test_bytes(dut, payload_data=None):
+
+    tb = TB(dut, wishboneStandardMemorySlave, size=2**12)
+
+    await tb.reset()
+
+    test_data = bytes(payload_data())
+
+    tb.slave.load(0, b'\xff' * tb.slave.size)
+
+    await tb.master.write_bytes(3, test_data)
+
+    assert tb.slave.dump(0, 3) == b'\xff' * 3, "BYTES BEFORE WRITE CHANGED"
+
+    assert tb.slave.dump(3, len(test_data)) == test_data, "WRITTEN BYTES DO NOT MATCH"
+
+    assert tb.slave.dump(3 + len(test_data), 5) == b'\xff' * 5, "BYTES AFTER WRITE CHANGED"
+
+# Function: run_test_bulk
+# Tests bulk byte reads and writes at unaligned byte addresses.
+async def run_test_bulk(dut, payload_data=None):
+
+    tb = TB(dut, wishboneStandardMemorySlave, size=2**16)
+
+    await tb.reset()
+
+    test_data = bytes(payload_data()) * 16
+
+    tb.slave.load(1, test_data)
+
+    rx_data = await tb.master.read_bytes(1, len(test_data))
+
+    assert test_data == rx_data, "READ BYTES DO NOT MATCH LOADED DATA"
+
+    await tb.master.write_bytes(4099, test_data)
+
+    rx_data = await tb.master.read_bytes(4099, len(test_data))
+
+    assert test_data == rx_data, "READ BYTES DO NOT MATCH WRITTEN DATA"
+
+# Function: run_test_model
+# Tests the zero time model master against the same slave models, no simulation time may pass.
+async def run_test_model(dut, payload_data=None, slave=wishboneStandardEchoSlave):
+
+    tb = TB(dut, slave)
+
+    await tb.reset()
+
+    master = wishboneStandardModelMaster(tb.slave, len(dut.s_wb_sel))
+
+    start = get_sim_time()
+
+    test_data = payload_data()
+
+    await master.write(test_data, test_data)
+
+    rx_data = await master.read(test_data)
+
+    assert test_data == rx_data, "RECEIVED DATA DOES NOT MATCH"
+
+    assert master.cycle == 2 * (len(test_data) + 1), "BURST CYCLE COUNT DOES NOT MATCH"
+
+    for test_value in test_data[:16]:
+
+        await master.write(test_value, test_value + 1)
+
+        rx_data = await master.read(test_value)
+
+        assert test_value + 1 == rx_data, "RECEIVED DATA DOES NOT MATCH"
+
+    assert get_sim_time() == start, "SIMULATION TIME PASSED"
+
+    rx_data = await tb.master.read(test_data[:16])
+
+    assert [d + 1 for d in test_data[:16]] == rx_data, "PIN MASTER DOES NOT SEE MODEL WRITES"
+
+# Function: run_test_stats
+# Tests the traffic counters of the slave and monitor agree with the traffic sent.
+async def run_test_stats(dut, payload_data=None):
+
+    tb = TB(dut, stats=True)
+
+    monitor = wishboneStandardMonitor(dut, "s_wb", dut.clk, dut.rst, stats=True)
+
+    await tb.reset()
+
+    test_data = payload_data()
+
+    await tb.master.write(test_data, test_data)
+
+    rx_data = await tb.master.read(test_data)
+
+    assert test_data == rx_data, "RECEIVED DATA DOES NOT MATCH"
+
+    await tb.master.write(test_data[0], test_data[0], 0b1)
+
+    await RisingEdge(dut.clk)
+
+    width = len(dut.s_wb_sel)
+
+    for stats in (tb.slave.stats(), monitor.stats()):
+        assert stats["reads"] == len(test_data), "READ COUNT DOES NOT MATCH"
+        assert stats["writes"] == len(test_data) + 1, "WRITE COUNT DOES NOT MATCH"
+        assert stats["bytes"] == 2 * len(test_data) * width + 1, "BYTE COUNT DOES NOT MATCH"
+        assert sum(stats["latency"].values()) == 2 * len(test_data) + 1, "LATENCY COUNT DOES NOT MATCH"
+        assert stats["active"] + stats["wait"] + stats["idle"] == stats["cycles"], "CYCLE COUNTS DO NOT ADD UP"
+
+    monitor.reset_stats()
+
+    assert monitor.stats()["reads"] == 0, "RESET DID NOT ZERO COUNTERS"
+
+    assert tb.master.stats() is None, "COUNTERS NOT OFF BY DEFAULT"
+
+# Function: run_test_trace
+# Tests the monitor trace file is read back with the transfers sent, and filters by address and time.
+async def run_test_trace(dut, payload_data=None):
+
+    tb = TB(dut)
+
+    handle, filename = tempfile.mkstemp(suffix=".wbtr")
+
+    os.close(handle)
+
+    monitor = wishboneStandardMonitor(dut, "s_wb", dut.clk, dut.rst, trace=filename)
+
+    await tb.reset()
+
+    test_data = payload_data()
+
+    await tb.master.write(test_data, test_data)
+
+    middle = get_sim_time()
+
+    rx_data = await tb.master.read(test_data)
+
+    assert test_data == rx_data, "RECEIVED DATA DOES NOT MATCH"
+
+    await RisingEdge(dut.clk)
+
+    monitor.close_trace()
+
+    with wishboneStandardTraceReader(filename) as trace:
+        assert len(trace) == 2 * len(test_data), "TRACE LENGTH DOES NOT MATCH"
+
+        assert [t.data for time, t in trace] == test_data + test_data, "TRACE DATA DOES NOT MATCH"
+
+        assert [t.we for time, t in trace.filter(stop=middle + 1)] == [1] * len(test_data), "TIME WINDOW DOES NOT MATCH"
+
+        assert [t.address for time, t in trace.filter(16, 32, start=middle + 1)] == list(range(16, 32)), "ADDRESS RANGE DOES NOT MATCH"
+
+    with wishboneStandardTraceWriter(filename) as writer:
+        writer.write(wishboneStandardTrans(3))
+
+    with wishboneStandardTraceReader(filename) as trace:
+        assert trace[0][1].data is None and trace[0][1].we == 0, "UNRESOLVED DATA NOT KEPT"
+
+    os.remove(filename)
+
+# Function: run_test_replay
+# Tests replay of the same traffic from CSV, JSON lines and a monitor trace, with timing and a wrong expectation.
+async def run_test_replay(dut, payload_data=None):
+
+    tb = TB(dut)
+
+    await tb.reset()
+
+    test_data = payload_data()
+
+    files = []
+
+    for suffix in (".csv", ".jsonl", ".wbtr"):
+        handle, filename = tempfile.mkstemp(suffix=suffix)
+        os.close(handle)
+        files.append(filename)
+
+    with open(files[0], "w") as f:
+        f.write("time,we,address,data,sel\n")
+        for time, value in enumerate(test_data):
+            f.write(f"{time * 4},w,{value},{hex(value + 1)},\n")
+            f.write(f"{time * 4 + 2},r,{value},{value + 1},\n")
+
+    monitor = wishboneStandardMonitor(dut, "s_wb", dut.clk, dut.rst, trace=files[2])
+
+    start = get_sim_time()
+
+    assert await wishboneStandardReplay(tb.master, files[0], timing=True).run() == 0, "CSV REPLAY READ MISMATCH"
+
+    assert get_sim_time() - start >= (len(test_data) - 1) * 4, "CSV REPLAY DID NOT KEEP TIMING"
+
+    await RisingEdge(dut.clk)
+
+    monitor.close_trace()
+
+    with open(files[1], "w") as f:
+        for value in test_data:
+            f.write(f'{{"we": 1, "address": {value}, "data": {value + 2}}}\n')
+        f.write(f'{{"we": 0, "address": {test_data[0]}, "data": {test_data[0]}}}\n')
+
+    assert await wishboneStandardReplay(tb.master, files[1]).run() == 1, "JSON REPLAY MISSED A WRONG READ"
+
+    assert await wishboneStandardReplay(tb.master, files[2]).run() == 0, "TRACE REPLAY READ MISMATCH"
+
+    rx_data = await tb.master.read(test_data)
+
+    assert [d + 1 for d in test_data] == rx_data, "REPLAYED WRITES DO NOT MATCH"
+
+    for filename in files:
+        os.remove(filename)
+
+# Function: run_test_byteorder
+# Tests byte reads and writes, and word packing, in both byte orders.
+async def run_test_byteorder(dut, payload_data=None, byteorder="little"):
+
+    tb = TB(dut, wishboneStandardMemorySlave, byteorder=byteorder, size=2**12)
+
+    await tb.reset()
+
+    width = tb.master.data_width // 8
+
+    assert width == len(dut.s_wb_data_o) // 8, "DATA WIDTH NOT DETECTED"
+
+    assert tb.master.address_width == len(dut.s_wb_addr), "ADDRESS WIDTH NOT DETECTED"
+
+    test_data = bytes(payload_data())
+
+    words = tb.master.pack(test_data)
+
+    assert words[0] == int.from_bytes(test_data[:width], byteorder), "PACKED WORD DOES NOT MATCH"
+
+    assert tb.master.unpack(words) == test_data, "UNPACKED BYTES DO NOT MATCH"
+
+    await tb.master.write(list(range(len(words))), words)
+
+    assert tb.slave.dump(0, len(test_data)) == test_data, "WRITTEN WORDS DO NOT MATCH BYTES"
+
+    await tb.master.write_bytes(len(test_data) + 1, test_data)
+
+    rx_data = await tb.master.read_bytes(len(test_data) + 1, len(test_data))
+
+    assert test_data == rx_data, "READ BYTES DO NOT MATCH WRITTEN BYTES"
+
+    assert tb.slave.dump(len(test_data) + 1, len(test_data)) == test_data, "WRITTEN BYTES DO NOT MATCH"
+
+# Function: run_test_pool
+# Tests that transactions go back to the pool once they are done.
+async def run_test_pool(dut, payload_data=None):
+
+    pool = wishboneStandardTransPool()
+
+    tb = TB(dut, pool=pool)
+
+    await tb.reset()
+
+    test_data = payload_data()
+
+    await tb.master.write(test_data, test_data)
+
+    rx_data = await tb.master.read(test_data)
+
+    assert test_data == rx_data, "RECEIVED DATA DOES NOT MATCH"
+
+    assert len(pool) > 0, "NO TRANSACTIONS RETURNED TO THE POOL"
+
+    size = len(pool)
+
+    handle = tb.master.issue_read(test_data[:4])
+
+    assert test_data[:4] == await handle, "RECEIVED DATA DOES NOT MATCH"
+
+    tb.master.release(handle)
+
+    assert len(pool) == size, "RELEASED TRANSACTIONS NOT RETURNED TO THE POOL"
+
+    assert not hasattr(wishboneStandardTrans(0), "__dict__"), "TRANSACTION HAS A __dict__"
+
+# Function: run_test_monitor
+# Tests that the monitor rebuilds every transfer the master makes.
+async def run_test_monitor(dut, payload_data=None):
+
+    tb = TB(dut)
+
+    observed = []
+
+    tb.monitor.add_callback(observed.append)
+
+    await tb.reset()
+
+    test_data = payload_data()
+
+    await tb.master.write(test_data, test_data)
+
+    rx_data = await tb.master.read(test_data)
+
+    await RisingEdge(dut.clk)
+
+    assert test_data == rx_data, "RECEIVED DATA DOES NOT MATCH"
+
+    assert len(observed) == 2 * len(test_data), "MONITOR MISSED TRANSFERS"
+
+    assert [t.address for t in observed] == test_data * 2, "MONITOR ADDRESSES DO NOT MATCH"
+
+    assert [t.data for t in observed] == test_data * 2, "MONITOR DATA DOES NOT MATCH"
+
+    assert [t.we for t in observed] == [1] * len(test_data) + [0] * len(test_data), "MONITOR DIRECTION DOES NOT MATCH"
+
+# Function: run_test_handles
+# Tests handles from many concurrent agents, reads must see the writes queued before them.
+async def run_test_handles(dut, payload_data=None):
+
+    tb = TB(dut)
+
+    await tb.reset()
+
+    test_data = payload_data()
+
+    async def agent(offset):
+        handles = []
+        for test_value in test_data[offset::4]:
+            handles.append((test_value, tb.master.issue_write(test_value, test_value + 1)))
+            handles.append((test_value, tb.master.issue_read(test_value)))
+
+        for test_value, handle in handles:
+            rx_data = await handle
+            if rx_data is not None:
+                assert test_value + 1 == rx_data, "RECEIVED DATA DOES NOT MATCH"
+
+    agents = [cocotb.start_soon(agent(i)) for i in range(4)]
+
+    for a in agents:
+        await a
+
+# Function: run_test_wait
+# Tests single transfers and bursts against a slave with wait states. wait is a number of
+# wait states, or a function that makes a new wait profile so every test starts it fresh.
+async def run_test_wait(dut, payload_data=None, wait=0):
+
+    tb = TB(dut, wait=wait() if callable(wait) else wait)
+
+    await tb.reset()
+
+    test_data = payload_data()
+
+    await tb.master.write(test_data, test_data)
+
+    rx_data = await tb.master.read(test_data)
+
+    assert test_data == rx_data, "RECEIVED DATA DOES NOT MATCH"
+
+    for test_value in test_data[:16]:
+
+        await tb.master.write(test_value, test_value + 1)
+
+        rx_data = await tb.master.read(test_value)
+
+        assert test_value + 1 == rx_data, "RECEIVED DATA DOES NOT MATCH"
+
+# Function: run_test_faults
+# Tests that RTY is retried, ERR is reported and a missing termination times out.
+async def run_test_faults(dut, payload_data=None):
+
+    tb = TB(dut, faults=wishboneStandardFaults(rty_rate=0.25, err_addresses=[7], seed=1))
+
+    await tb.reset()
+
+    test_data = [value for value in payload_data() if value != 7]
+
+    await tb.master.write(test_data, test_data)
+
+    rx_data = await tb.master.read(test_data)
+
+    assert test_data == rx_data, "RECEIVED DATA DOES NOT MATCH"
+
+    handle = tb.master.issue_read(7)
+
+    await handle
+
+    assert handle.status() == wishboneStandardStatus.ERR, "ERR NOT REPORTED"
+
+    tb.slave.faults = None
+    tb.slave.wait = 8
+    tb.master.timeout = 4
+
+    handle = tb.master.issue_read(0)
+
+    await handle
+
+    assert handle.status() == wishboneStandardStatus.TIMEOUT, "TIMEOUT NOT REPORTED"
+
+# Function: run_test_callback
+# Tests a callback slave with handler, stored, read only, clear on read, async and fallback ranges.
+async def run_test_callback(dut, payload_data=None):
+
+    tb = TB(dut, slave=wishboneStandardCallbackSlave, fallback=wishboneStandardMemory(2**16))
+
+    log = []
+
+    async def slow_read(offset):
+        for _ in range(3):
+            await RisingEdge(dut.clk)
+        return offset + 0x100
+
+    count = itertools.count()
+
+    async def fifo_read(offset):
+        for _ in range(3):
+            await RisingEdge(dut.clk)
+        return next(count)
+
+    regs = {}
+
+    tb.slave.add_range(0x1000, 16, read=lambda offset: offset * 2, write=lambda offset, data, sel: log.append((offset, data)))
+    tb.slave.add_range(0x2000, 4, read=slow_read)
+    tb.slave.add_range(0x3000, 1, read=lambda offset: 0xbeef, access=wishboneStandardAccess.RO)
+    status = tb.slave.add_range(0x3001, 1, access=wishboneStandardAccess.RC)
+    tb.slave.add_range(0x3002, 1, read=lambda offset: regs.get(offset, 0), write=lambda offset, data, sel: regs.__setitem__(offset, data), access=wishboneStandardAccess.RC)
+    tb.slave.add_range(0x4000, 1, read=fifo_read)
+
+    await tb.reset()
+
+    test_data = list(payload_data())
+
+    await tb.master.write(test_data, test_data)
+
+    rx_data = await tb.master.read(test_data)
+
+    assert test_data == rx_data, "RECEIVED DATA DOES NOT MATCH"
+
+    await tb.master.write(0x1003, 7)
+
+    assert log == [(3, 7)], "WRITE HANDLER NOT CALLED"
+
+    assert await tb.master.read(0x1005) == 10, "READ HANDLER DATA DOES NOT MATCH"
+
+    assert await tb.master.read([0x2000, 0x2003]) == [0x100, 0x103], "ASYNC READ HANDLER DATA DOES NOT MATCH"
+
+    assert await tb.master.read(0x3000) == 0xbeef, "READ ONLY DATA DOES NOT MATCH"
+
+    handle = tb.master.issue_write(0x3000, 0)
+
+    await handle
+
+    assert handle.status() == wishboneStandardStatus.ERR, "WRITE TO READ ONLY NOT REPORTED"
+
+    status.values[0] = 5
+
+    assert await tb.master.read([0x3001, 0x3001]) == [5, 0], "CLEAR ON READ DID NOT CLEAR"
+
+    regs[0] = 9
+
+    assert await tb.master.read([0x3002, 0x3002]) == [9, 0], "CLEAR ON READ WITH HANDLER DID NOT CLEAR"
+
+    timeout = tb.master.timeout
+    tb.master.timeout = 2
+
+    handle = tb.master.issue_read(0x4000)
+
+    await handle
+
+    assert handle.status() == wishboneStandardStatus.TIMEOUT, "TIMEOUT NOT REPORTED"
+
+    tb.master.timeout = timeout
+
+    assert await tb.master.read(0x4000) == 1, "RESULT OF A TIMED OUT CALL WAS USED"
+
+    try:
+        tb.slave.add_range(0x5000, 1, read=lambda offset: 0, access=wishboneStandardAccess.RC)
+    except ValueError:
+        pass
+    else:
+        assert False, "RC RANGE WITHOUT A WRITE HANDLER NOT REJECTED"
+
+    try:
+        tb.slave.add_range(0x100f, 2)
+    except ValueError:
+        pass
+    else:
+        assert False, "OVERLAPPING RANGE NOT REJECTED"
+
+# Function: run_test_generator
+# Tests that constrained random traffic stops once the monitor coverage is closed.
+async def run_test_generator(dut, payload_data=None, idle=0):
+
+    tb = TB(dut)
+
+    full = 2**(tb.master.data_width // 8) - 1
+
+    coverage = wishboneStandardCoverage()
+    coverage.add_direction()
+    coverage.add_address(0, 255, 8)
+    coverage.add_sel([full, 1, full ^ 1])
+    coverage.add_burst([1, 2, 3, 4])
+    coverage.add_cross("we_address", "we", "address")
+
+    monitor = wishboneStandardMonitor(dut, "s_wb", dut.clk, dut.rst, coverage=coverage)
+
+    generator = wishboneStandardGenerator(tb.master, seed=1, addresses=[(0, 127), (128, 255, 3)], burst=(1, 4), sel=[full, 1, full ^ 1], idle=idle)
+
+    await tb.reset()
+
+    count = await generator.run(count=len(payload_data()), coverage=coverage)
+
+    assert coverage.done(), f"COVERAGE NOT CLOSED, HOLES {coverage.holes()}"
+
+    assert count < len(payload_data()), "GENERATOR DID NOT STOP AT COVERAGE CLOSURE"
+
+# Function: run_test_asynchronous
+# Tests asynchronous termination, back to back single writes are ACKed every cycle.
+async def run_test_asynchronous(dut, payload_data=None, wait=0):
+
+    tb = TB(dut, asynchronous=True, wait=wait)
+
+    await tb.reset()
+
+    test_data = list(payload_data())
+
+    start = get_sim_time("ns")
+
+    handles = [tb.master.issue_write(address, address) for address in test_data]
+
+    for handle in handles:
+        await handle
+
+    cycles = (get_sim_time("ns") - start) / 2
+
+    assert cycles <= len(test_data) * (wait + 1) + 2, f"WRITES TOOK {cycles} CYCLES"
+
+    rx_data = await tb.master.read(test_data)
+
+    assert test_data == rx_data, "RECEIVED DATA DOES NOT MATCH"
+
+    for address in test_data[:16]:
+        assert address == await tb.master.read(address), "RECEIVED DATA DOES NOT MATCH"
+
+# Function: run_test_scheduler
+# Tests a master, slave and monitor stepped by one scheduler instead of their own loops.
+async def run_test_scheduler(dut, payload_data=None, asynchronous=False):
+
+    cocotb.start_soon(Clock(dut.clk, 2, units="ns").start())
+
+    scheduler = wishboneStandardScheduler(dut.clk)
+
+    master = wishboneStandardMaster(dut, "s_wb", dut.clk, dut.rst, scheduler=scheduler)
+    slave = wishboneStandardEchoSlave(dut, "s_wb", dut.clk, dut.rst, asynchronous=asynchronous, scheduler=scheduler)
+    monitor = wishboneStandardMonitor(dut, "s_wb", dut.clk, dut.rst, scheduler=scheduler)
+
+    transfers = []
+    monitor.add_callback(transfers.append)
+
+    dut.rst.setimmediatevalue(1)
+    await Timer(5, units="ns")
+    dut.rst.value = 0
+
+    assert scheduler.agents() == ([master, monitor, slave] if asynchronous else [master, slave, monitor]), "AGENTS NOT ADDED IN ORDER"
+
+    test_data = list(payload_data())
+
+    await master.write(test_data, test_data)
+
+    rx_data = await master.read(test_data)
+
+    assert test_data == rx_data, "RECEIVED DATA DOES NOT MATCH"
+
+    for test_value in test_data[:16]:
+        await master.write(test_value, test_value + 1)
+
+        assert test_value + 1 == await master.read(test_value), "RECEIVED DATA DOES NOT MATCH"
+
+    await RisingEdge(dut.clk)
+
+    assert len(transfers) == 2 * len(test_data) + 32, "MONITOR MISSED TRANSFERS"
+
+# Function: run_test_scoreboard
+# Tests the scoreboard follows monitored traffic, checks reads and finds corrupted memory.
+async def run_test_scoreboard(dut, payload_data=None):
+
+    tb = TB(dut, slave=wishboneStandardMemorySlave)
+
+    width = tb.master.data_width // 8
+
+    scoreboard = wishboneStandardScoreboard(tb.slave.size, width)
+
+    tb.monitor.add_callback(scoreboard.sample)
+
+    await tb.reset()
+
+    test_data = list(payload_data())
+
+    await tb.master.write(test_data, test_data)
+
+    await tb.master.write(test_data[:16], [0] * 16, sel=1)
+
+    await tb.master.read(test_data)
+
+    assert scoreboard.checked == len(test_data), "READS NOT CHECKED"
+
+    assert not scoreboard.errors, f"READ MISMATCHES {scoreboard.errors}"
+
+    assert scoreboard.compare(tb.slave) == [], "IMAGE DOES NOT MATCH"
+
+    tb.slave.load(5 * width + 1, b"\xaa\xbb")
+    tb.slave.load(200 * width, b"\xcc")
+
+    assert scoreboard.compare(tb.slave) == [(5 * width + 1, 5 * width + 3), (200 * width, 200 * width + 1)], "MISMATCH RANGES DO NOT MATCH"
+
+    # bytes never written are not checked.
+    tb.slave.load(1000 * width, b"\xdd")
+
+    assert len(scoreboard.compare(tb.slave)) == 2, "UNWRITTEN BYTES CHECKED"
+
+    await tb.master.read(5)
+
+    await RisingEdge(dut.clk)
+
+    assert len(scoreboard.errors) == 1 and scoreboard.errors[0][0] == 5, "READ MISMATCH NOT FOUND"
+
+    scoreboard.expect(1000, 0xdd, sel=1)
+
+    assert len(scoreboard.compare(tb.slave)) == 2, "EXPECTED BYTES DO NOT MATCH"
+
+    scoreboard.expect(1000, 0xee, sel=1)
+
+    assert len(scoreboard.compare(tb.slave)) == 3, "EXPECTED BYTES NOT CHECKED"
 
 # Function: incrementing_payload
 # Generate a list of ints that increment from 0 to 2^8
 def incrementing_payload():
     return list(range(2**8))
 
+# Function: wrapping_payload
+# Generate a list of ints that wrap inside aligned blocks of 4, 8, and 16
+def wrapping_payload():
+    return [2, 3, 0, 1] + [13, 14, 15, 8, 9, 10, 11, 12] + [37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 32, 33, 34, 35, 36]
+
+# Function: random_wait
+# Make a seeded random wait profile of 0 to 3 wait states.
+def random_wait():
+    return wishboneStandardWaitRandom(0, 3, seed=1)
+
+# Function: trace_wait
+# Make a wait profile that repeats a short recorded pattern.
+def trace_wait():
+    return wishboneStandardWaitTrace([0, 0, 2, 1])
+
 # # Function: random_payload
 # # Generate a list of random ints 2^16 in the range of 0 to 2^16
 # def random_payload():
@@ -134,6 +836,88 @@ if cocotb.SIM_NAME:
     factory.add_option("payload_data", [incrementing_payload])
     factory.generate_tests()
 
+    factory = TestFactory(run_test_memory)
+    factory.add_option("payload_data", [incrementing_payload])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_bytes)
+    factory.add_option("payload_data", [incrementing_payload])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_bulk)
+    factory.add_option("payload_data", [incrementing_payload])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_model)
+    factory.add_option("payload_data", [incrementing_payload])
+    factory.add_option("slave", [wishboneStandardEchoSlave, wishboneStandardMemorySlave])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_stats)
+    factory.add_option("payload_data", [incrementing_payload])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_trace)
+    factory.add_option("payload_data", [incrementing_payload])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_replay)
+    factory.add_option("payload_data", [incrementing_payload])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_byteorder)
+    factory.add_option("payload_data", [incrementing_payload])
+    factory.add_option("byteorder", ["little", "big"])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_pool)
+    factory.add_option("payload_data", [incrementing_payload])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_monitor)
+    factory.add_option("payload_data", [incrementing_payload, wrapping_payload])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_handles)
+    factory.add_option("payload_data", [incrementing_payload])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_wait)
+    factory.add_option("payload_data", [incrementing_payload, wrapping_payload])
+    factory.add_option("wait", [1, 3, random_wait, trace_wait])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_faults)
+    factory.add_option("payload_data", [incrementing_payload, wrapping_payload])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_burst)
+    factory.add_option("payload_data", [incrementing_payload, wrapping_payload])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_callback)
+    factory.add_option("payload_data", [incrementing_payload])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_asynchronous)
+    factory.add_option("payload_data", [incrementing_payload, wrapping_payload])
+    factory.add_option("wait", [0, 2])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_scheduler)
+    factory.add_option("payload_data", [incrementing_payload, wrapping_payload])
+    factory.add_option("asynchronous", [False, True])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_scoreboard)
+    factory.add_option("payload_data", [incrementing_payload])
+    factory.generate_tests()
+
+    factory = TestFactory(run_test_generator)
+    factory.add_option("payload_data", [incrementing_payload])
+    factory.add_option("idle", [0, (0, 2)])
+    factory.generate_tests()
+
 
 # cocotb-test
 tests_dir = os.path.dirname(__file__)
@@ -56,6 +56,9 @@
  *   s_wb_ack         - Bus transaction terminated
  *   s_wb_data_o      - Output data
  *   s_wb_err         - Active high when a bus error is present
+ *   s_wb_rty         - Active high when the slave asks for a retry
+ *   s_wb_cti         - Cycle type identifier, registered feedback bursts
+ *   s_wb_bte         - Burst type extension, linear or wrapping bursts
  */
 module test #(
     parameter ADDRESS_WIDTH = 16,
@@ -72,7 +75,10 @@ module test #(
     inout   [BUS_WIDTH-1:0]                         s_wb_sel,
     inout                                           s_wb_ack,
     inout   [BUS_WIDTH*8-1:0]                       s_wb_data_o,
-    inout                                           s_wb_err
+    inout                                           s_wb_err,
+    inout                                           s_wb_rty,
+    inout   [2:0]                                   s_wb_cti,
+    inout   [1:0]                                   s_wb_bte
   );
 
   //copy pasta, fst generation